@@ -13,28 +13,59 @@ Usage:
 
 import sys
 import os
+import stat
 import argparse
+import copy
+import datetime
+import fnmatch
+import functools
+import glob
+import importlib
+import itertools
+import json
+import time
+from collections import deque
+from dataclasses import dataclass, fields
 from pathlib import Path
 
-# Import our existing modules
+# Heavy modules (qr_enhanced pulls in PIL/qrcode/cryptography, qr_scan pulls in
+# cv2/pyzbar) are imported lazily inside the command handlers so that cheap
+# paths like "qr --help" and "qr config show" don't pay their import cost.
+
+# Summary reports can carry thousands of file entries; prefer orjson's
+# C-extension encoder when it is installed, otherwise fall back to stdlib json.
+# Both branches produce pretty-printed UTF-8 bytes.
 try:
-    from qr_enhanced import QRTransferTool, QRCrypto, HAS_CRYPTO, HAS_TQDM
-    from qr_scan import QRBatchScanner
-    from qr_config import QRConfig
-    import qr_rebuild
-    import qr_rebuild_encrypted
-    import qr_rebuild_verified
-except ImportError as e:
-    print(f"❌ Error importing modules: {e}")
-    print("   Make sure all QR tool files are in the same directory")
-    sys.exit(1)
+    import orjson
 
-class QRUnifiedCLI:
-    """Unified CLI for QR File Transfer Tool"""
-    
-    def __init__(self):
-        self.version = "3.0.0"
-        self.description = """
+    def _dump_json_bytes(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _dump_json_bytes(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _print_traceback():
+    """Print the active exception traceback (traceback imported on first failure only)"""
+    import traceback
+    traceback.print_exc()
+
+# Precomputed error prefix - error lines go straight to stderr without
+# per-call f-string prefix assembly
+_ERROR_PREFIX = "❌ Error: "
+
+def _print_error(message):
+    """Write an error line to stderr, falling back to ASCII on encode errors"""
+    line = _ERROR_PREFIX + str(message) + "\n"
+    try:
+        sys.stderr.write(line)
+    except UnicodeEncodeError:
+        sys.stderr.write(line.encode('ascii', 'replace').decode('ascii'))
+
+_VERSION = "3.0.0"
+
+# Help/epilog text is built once at import time instead of on every
+# parser construction.
+_DESCRIPTION = """
 QR File Transfer Tool v3.0 - Global CLI for secure file transfer via QR codes
 ══════════════════════════════════════════════════════════════════════════════
 
@@ -61,41 +92,8 @@ and secure file transfer workflows. Now globally installable!
   • Organized output structure: qr generate ./files/ -o ./qr_backup/
   • Complete read workflow: qr read ./photos/ --auto-rebuild
         """
-    
-    def _safe_print(self, text):
-        """Safe printing that handles Unicode issues across different terminals"""
-        try:
-            print(text)
-        except UnicodeEncodeError:
-            # Fallback for terminals that can't handle Unicode (like Windows cmd with cp1252)
-            # Replace problematic Unicode characters with ASCII alternatives
-            fallback_text = text
-            fallback_text = fallback_text.replace('🚀', '>>>')
-            fallback_text = fallback_text.replace('✨', '***')
-            fallback_text = fallback_text.replace('🎯', '>>>')
-            fallback_text = fallback_text.replace('📸', '[SCAN]')
-            fallback_text = fallback_text.replace('🔧', '[BUILD]')
-            fallback_text = fallback_text.replace('🔍', '[DETECT]')
-            fallback_text = fallback_text.replace('✅', '[OK]')
-            fallback_text = fallback_text.replace('❌', '[ERR]')
-            fallback_text = fallback_text.replace('⚠️', '[WARN]')
-            fallback_text = fallback_text.replace('📁', '[DIR]')
-            fallback_text = fallback_text.replace('📄', '[FILE]')
-            fallback_text = fallback_text.replace('•', '*')
-            fallback_text = fallback_text.replace('═', '=')
-            try:
-                print(fallback_text)
-            except UnicodeEncodeError:
-                # Last resort: encode to ASCII with replacement
-                print(text.encode('ascii', 'replace').decode('ascii'))
-    
-    def create_parser(self):
-        """Create the main argument parser with subcommands"""
-        parser = argparse.ArgumentParser(
-            prog='qr',
-            description=self.description,
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
+
+_MAIN_EPILOG = """
 Common workflows:
   qr generate file.txt --sheet              # Create QR sheets for easy scanning
   qr generate ./documents/ --sheet          # Batch process entire folder  
@@ -121,11 +119,350 @@ For detailed help on any command:
 
 Project: https://github.com/PSEUDONYM97/qr-file-transfer
 Issues: https://github.com/PSEUDONYM97/qr-file-transfer/issues
-Version: """ + self.version
+Version: """ + _VERSION
+
+_GENERATE_EPILOG = """
+Examples:
+  qr generate document.txt                   # Single file QR generation
+  qr generate ./documents/                   # Process entire folder
+  qr generate document.txt --sheet           # Generate organized sheets
+  qr generate secret.txt --encrypt           # AES-256 encrypted QR codes
+  qr generate ./folder/ --output ./qr_out/   # Organized batch processing
+  qr generate large.txt --sheet --verbose    # Detailed progress output
+  qr generate file.txt --box-size 8          # Smaller QR codes
+            """
+
+_SCAN_EPILOG = """
+Examples:
+  qr scan ./photos/                         # Scan all images in folder
+  qr scan ./images/ -o ./chunks/            # Custom output directory
+  qr scan ./qr_sheets/ --auto-rebuild       # Scan and auto-reconstruct files
+  qr scan ./mobile_photos/ --organized      # Create organized output structure
+  qr scan ./scans/ --pattern "*.png"        # Process only PNG files
+  qr scan ./photos/ --verbose               # Detailed scanning progress
+            """
+
+_REBUILD_EPILOG = """
+Examples:
+  qr rebuild ./scanned_chunks/              # Basic reconstruction
+  qr rebuild ./chunks/ --verify             # With integrity verification
+  qr rebuild ./chunks/ --encrypted          # Decrypt encrypted chunks
+  qr rebuild ./chunks/ --spaces             # Convert tabs to spaces
+  qr rebuild ./chunks/ -o ./restored/       # Organized output directory
+  qr rebuild ./chunks/ --organized          # Create organized output structure
+  qr rebuild ./chunks/ --batch              # Process multiple file sets
+            """
+
+_CONFIG_EPILOG = """
+Examples:
+  qr config show                           # Display current settings
+  qr config reset                          # Reset to default settings
+  qr config --file ~/.qr-config.json      # Use custom config file
+            """
+
+_READ_EPILOG = """
+🚀 v2.0 Simplified Interface:
+  qr read ./photos/              # Auto-detects QR images, scans + rebuilds
+  qr read ./chunks/              # Auto-detects chunk files, rebuilds directly
+  qr read ./mixed_folder/        # Handles both images and chunks intelligently
+  qr read single_image.png       # Processes single QR image
+  qr read chunk_001.txt          # Processes single chunk file
+
+🔍 Auto-Detection Features:
+  • Automatically identifies QR images (.png, .jpg, .jpeg, .bmp, .tiff)
+  • Recognizes QR chunk files (.txt with QR headers)
+  • Handles mixed directories (both images and chunks)
+  • Auto-rebuild enabled by default for QR images
+  • Organized output structure with session timestamps
+
+🎯 Advanced Options:
+  qr read ./folder/ --mode scan-only     # Only scan, don't rebuild
+  qr read ./folder/ --mode rebuild-only  # Only rebuild from chunks
+  qr read ./folder/ --as-images          # Force treat as QR images
+  qr read ./folder/ --as-chunks          # Force treat as chunk files
+            """
+
+# Emoji → ASCII fallback table, built once; str.translate applies it in a
+# single C-level pass instead of a chain of str.replace calls per print.
+# '️' is the variation selector that trails ⚠️ and friends.
+_ASCII_FALLBACK = str.maketrans({
+    '🚀': '>>>', '✨': '***', '🎯': '>>>', '📸': '[SCAN]', '🔧': '[BUILD]',
+    '🔍': '[DETECT]', '✅': '[OK]', '❌': '[ERR]', '⚠': '[WARN]',
+    '📁': '[DIR]', '📄': '[FILE]', '•': '*', '═': '=', '️': '',
+})
+
+def _stdout_handles_unicode():
+    """Probe stdout's encoding once so per-print calls don't rely on raising
+    UnicodeEncodeError to discover an ASCII-only terminal"""
+    encoding = getattr(sys.stdout, 'encoding', None) or 'ascii'
+    try:
+        '🚀'.encode(encoding)
+        return True
+    except (UnicodeEncodeError, LookupError):
+        return False
+
+# Extension tables for read auto-detection - frozensets give O(1) membership
+# tests in the per-file classification loops
+_IMAGE_EXTS = frozenset({'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.tif'})
+_CHUNK_EXTS = frozenset({'.txt'})
+
+# Batches up to this size are materialized eagerly (stable sort, exact
+# [i/N] progress); larger directory walks stream straight into the process
+# pool so QR work overlaps discovery I/O
+_EAGER_BATCH_LIMIT = 32
+
+# Directories recursive discovery never descends into - tool/VCS internals
+# and our own output trees, which can dwarf the actual input
+_SKIP_DIRS = frozenset({
+    '.git', '.hg', '.svn', 'node_modules', '__pycache__', '.venv', 'venv',
+    'qr_output', 'scan_output', 'rebuild_output', 'read_output',
+})
+
+@dataclass
+class _ReadOptions:
+    """Read-command options resolved once per invocation
+
+    run_read and its scan/rebuild argument converters used to repeat
+    getattr-with-default chains for every option; resolving them into one
+    object up front leaves plain attribute reads on the hot paths. Defaults
+    mirror the read parser so hand-built namespaces keep working.
+    """
+    verbose: bool = False
+    quiet: bool = False
+    as_images: bool = False
+    as_chunks: bool = False
+    mode: str = 'auto'
+    output: str = None
+    auto_rebuild: bool = True
+    verify_checksums: bool = True
+    encrypted: bool = False
+    spaces: bool = False
+    pattern: str = None
+    recursive: bool = False
+    organized: bool = True
+    auto_cleanup: bool = True
+    read_summary: bool = True
+    max_errors: int = 10
+
+    @classmethod
+    def from_namespace(cls, args):
+        present = vars(args)
+        return cls(**{f.name: present[f.name] for f in fields(cls) if f.name in present})
+
+@functools.lru_cache(maxsize=4096)
+def _sniff_chunk_file(path, mtime_ns, size):
+    """True when the file's head carries the QR chunk markers
+
+    The markers are pure ASCII, so a binary read and bytes scan skips the
+    UTF-8 decode and newline translation of a text-mode open. mtime_ns and
+    size key the cache so re-detections of an unchanged file skip the read.
+    """
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(256)
+    except OSError:
+        return False
+    return b'--BEGIN part_' in head and b'file:' in head
+
+class _FileInfo:
+    """Per-file processing record for batch generate
+
+    Slotted instead of a dict or plain dataclass: a big batch keeps one of
+    these per file, and fixed slots avoid the per-instance __dict__
+    (dataclass slots=True would do the same but needs Python 3.10, above
+    setup.py's floor). Pickles cleanly across the process pool.
+    """
+
+    __slots__ = ('file_path', 'file_name', 'success', 'qr_count',
+                 'sheet_count', 'encrypted', 'processing_time', 'error')
+
+    def __init__(self, file_path, file_name, encrypted=False):
+        self.file_path = file_path
+        self.file_name = file_name
+        self.success = False
+        self.qr_count = 0
+        self.sheet_count = 0
+        self.encrypted = encrypted
+        self.processing_time = 0
+        self.error = None
+
+    def as_dict(self):
+        """Plain dict form for the JSON batch summary"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+def _generate_worker(task):
+    """Run QRTransferTool for one file inside a worker process
+
+    Top-level (not a closure) so ProcessPoolExecutor can pickle it. The task
+    is a plain dict of serializable values rather than an argparse Namespace;
+    the per-file target directory travels as an explicit output_dir argument
+    so no process ever mutates its cwd.
+    """
+    file_path = task['file_path']
+    tool_opts = task['tool_opts']
+    file_start_time = time.time()
+    file_info = _FileInfo(file_path, os.path.basename(file_path),
+                          encrypted=tool_opts['encrypt'])
+
+    try:
+        from qr_enhanced import QRTransferTool
+
+        tool_args = argparse.Namespace(
+            file=file_path, output_dir=task['target_dir'], **tool_opts)
+        with QRTransferTool(tool_args) as tool:
+            if tool_opts['encrypt']:
+                tool.encryption_password = task['encryption_password']
+            tool.process_file(file_path)
+
+        file_info.success = True
+    except Exception as e:
+        file_info.error = str(e)
+
+    file_info.processing_time = round(time.time() - file_start_time, 2)
+    return file_info
+
+# Rebuild mode dispatch: the first flag that is set on the parsed args picks
+# the implementation module, with plain qr_rebuild as the fallback. The third
+# field names the keyword the module's rebuild() takes for the output
+# location (the verified rebuilder writes in place and takes none).
+_REBUILD_MODES = (
+    ('encrypted', 'qr_rebuild_encrypted', 'output_file'),
+    ('verify', 'qr_rebuild_verified', None),
+    ('spaces', 'qr_rebuild_spaces', 'output_dir'),
+    (None, 'qr_rebuild', 'output_dir'),
+)
+
+@functools.lru_cache(maxsize=None)
+def _rebuild_module(name):
+    """Import a qr_rebuild_* implementation once and cache the module object"""
+    return importlib.import_module(name)
+
+# Formatter class bound once - create_parser passes it to all six parsers
+_FMT = argparse.RawDescriptionHelpFormatter
+
+# Process-level parser cache shared by all QRUnifiedCLI instances, keyed by
+# command scope. Long-running drivers that construct a fresh CLI object per
+# invocation still reuse the built argparse trees. (A pickle-based disk cache
+# was considered but argparse parsers hold unpicklable local closures.)
+_PARSER_CACHE = {}
+
+# Option blocks shared by several subcommands, built once and attached via
+# parents=[...] so the argparse actions are constructed a single time instead
+# of being redefined per subparser.
+_PARENT_CACHE = {}
+
+def _common_parent():
+    """Parent parser with the folder/workflow options common to generate/scan/rebuild/read"""
+    parent = _PARENT_CACHE.get('common')
+    if parent is None:
+        parent = argparse.ArgumentParser(add_help=False)
+        common = parent.add_argument_group('Common Options')
+        common.add_argument('--pattern', metavar='GLOB',
+                            help='File pattern for folder processing (e.g., "*.txt")')
+        common.add_argument('--recursive', '-r', action='store_true',
+                            help='Process subdirectories recursively')
+        common.add_argument('--organized', action='store_true', default=True,
+                            help='Create organized output structure (default: enabled)')
+        common.add_argument('--no-organized', dest='organized', action='store_false',
+                            help='Disable organized output structure')
+        common.add_argument('--auto-cleanup', action='store_true', default=True,
+                            help='Automatically cleanup temporary files (default: enabled)')
+        _PARENT_CACHE['common'] = parent
+    return parent
+
+def _output_parent():
+    """Parent parser with the output control options common to all subcommands"""
+    parent = _PARENT_CACHE.get('output')
+    if parent is None:
+        parent = argparse.ArgumentParser(add_help=False)
+        output = parent.add_argument_group('Output Control')
+        # argparse enforces the quiet/verbose conflict at parse time, so the
+        # handlers don't need their own checks
+        verbosity = output.add_mutually_exclusive_group()
+        verbosity.add_argument('--verbose', '-v', action='store_true',
+                               help='Verbose output with detailed progress')
+        verbosity.add_argument('--quiet', '-q', action='store_true',
+                               help='Quiet mode (minimal output)')
+        output.add_argument('--no-progress', action='store_true',
+                            help='Disable progress bars')
+        output.add_argument('--no-emoji', action='store_true',
+                            help='Disable emoji in output (for compatibility)')
+        _PARENT_CACHE['output'] = parent
+    return parent
+
+class QRUnifiedCLI:
+    """Unified CLI for QR File Transfer Tool"""
+
+    # Command name (and alias) → handler method dispatch table
+    COMMAND_HANDLERS = {
+        'generate': 'run_generate', 'gen': 'run_generate', 'g': 'run_generate',
+        'read': 'run_read', 'r': 'run_read',
+        'scan': 'run_scan', 's': 'run_scan',
+        'rebuild': 'run_rebuild', 'rb': 'run_rebuild',
+        'config': 'run_config', 'cfg': 'run_config',
+    }
+
+    # Shared help text - class attributes so per-instance construction stays
+    # allocation-free (the literals themselves are built once at import time)
+    version = _VERSION
+    description = _DESCRIPTION
+
+    # Progress-line batching: flush after this many queued lines or this
+    # many seconds, whichever comes first
+    _FLUSH_EVERY = 50
+    _FLUSH_INTERVAL = 0.5
+
+    def __init__(self):
+        self._parsers = _PARSER_CACHE  # Built lazily per command scope, shared process-wide
+        self._unicode_out = _stdout_handles_unicode()
+        self._out_buf = []
+        self._out_last_flush = time.monotonic()
+
+    def _safe_print(self, text):
+        """Safe printing that handles Unicode issues across different terminals"""
+        if self._unicode_out:
+            try:
+                print(text)
+                return
+            except UnicodeEncodeError:
+                pass
+
+        # Terminal can't take emoji (like Windows cmd with cp1252): swap the
+        # known symbols for ASCII alternatives in one translate pass
+        fallback_text = text.translate(_ASCII_FALLBACK)
+        try:
+            print(fallback_text)
+        except UnicodeEncodeError:
+            # Last resort: encode to ASCII with replacement
+            print(fallback_text.encode('ascii', 'replace').decode('ascii'))
+
+    def _safe_print_many(self, lines):
+        """Emit several lines as one write, paying the fallback check once"""
+        self._safe_print("\n".join(lines))
+
+    def create_parser(self, command=None):
+        """Create the main argument parser (cached per command scope)
+
+        When the requested command is already known, only the matching
+        subparser tree is materialized - 'qr generate ...' never pays for
+        the read/scan/rebuild/config argparse trees. With no (or an
+        unknown) command, all subparsers are built so help output stays
+        complete.
+        """
+        scope = self.COMMAND_HANDLERS.get(command, '*')
+        cached = self._parsers.get(scope)
+        if cached is not None:
+            return cached
+
+        parser = argparse.ArgumentParser(
+            prog='qr',
+            description=self.description,
+            formatter_class=_FMT,
+            epilog=_MAIN_EPILOG
         )
-        
+
         parser.add_argument('--version', action='version', version=f'qr {self.version}')
-        
+
         # Create subparsers for commands
         subparsers = parser.add_subparsers(
             dest='command',
@@ -133,20 +470,25 @@ Version: """ + self.version
             description='Available operations (v2.0 simplified interface)',
             help='Use "qr <command> --help" for detailed help'
         )
-        
-        # Generate command
-        self.create_generate_parser(subparsers)
-        
-        # Read command (v2.0 unified)
-        self.create_read_parser(subparsers)
-        
-        # Legacy commands (v1.x compatibility)
-        self.create_scan_parser(subparsers)
-        self.create_rebuild_parser(subparsers)
-        
-        # Config command
-        self.create_config_parser(subparsers)
-        
+
+        if scope == '*':
+            # Generate command
+            self.create_generate_parser(subparsers)
+
+            # Read command (v2.0 unified)
+            self.create_read_parser(subparsers)
+
+            # Legacy commands (v1.x compatibility)
+            self.create_scan_parser(subparsers)
+            self.create_rebuild_parser(subparsers)
+
+            # Config command
+            self.create_config_parser(subparsers)
+        else:
+            # Only the requested subcommand's parser tree
+            getattr(self, 'create_%s_parser' % scope[len('run_'):])(subparsers)
+
+        self._parsers[scope] = parser
         return parser
     
     def create_generate_parser(self, subparsers):
@@ -156,17 +498,9 @@ Version: """ + self.version
             aliases=['gen', 'g'],
             help='Generate QR codes from files or folders',
             description='Convert files or entire folders to QR codes with optional encryption and integrity verification',
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
-Examples:
-  qr generate document.txt                   # Single file QR generation
-  qr generate ./documents/                   # Process entire folder
-  qr generate document.txt --sheet           # Generate organized sheets
-  qr generate secret.txt --encrypt           # AES-256 encrypted QR codes
-  qr generate ./folder/ --output ./qr_out/   # Organized batch processing
-  qr generate large.txt --sheet --verbose    # Detailed progress output
-  qr generate file.txt --box-size 8          # Smaller QR codes
-            """
+            formatter_class=_FMT,
+            epilog=_GENERATE_EPILOG,
+            parents=[_common_parent(), _output_parent()]
         )
         
         # Required arguments - now supports files or directories
@@ -178,19 +512,9 @@ Examples:
                              help='Output directory for organized QR codes (default: ./qr_output/)')
         io_group.add_argument('--preserve-structure', action='store_true',
                              help='Preserve folder structure in output directory')
-        io_group.add_argument('--pattern', metavar='GLOB',
-                             help='File pattern for folder processing (e.g., "*.txt")')
-        io_group.add_argument('--recursive', '-r', action='store_true',
-                             help='Process subdirectories recursively')
-        
+
         # Workflow options
         workflow = generate.add_argument_group('Workflow Options')
-        workflow.add_argument('--organized', action='store_true', default=True,
-                             help='Create organized output structure (default: enabled)')
-        workflow.add_argument('--no-organized', dest='organized', action='store_false',
-                             help='Disable organized output structure')
-        workflow.add_argument('--auto-cleanup', action='store_true', default=True,
-                             help='Automatically cleanup temporary files (default: enabled)')
         workflow.add_argument('--no-cleanup', dest='auto_cleanup', action='store_false',
                              help='Keep temporary files after generation')
         workflow.add_argument('--batch-summary', action='store_true', default=True,
@@ -207,16 +531,16 @@ Examples:
                           help='Generate QR code sheets (default: enabled)')
         output.add_argument('--no-sheet', dest='sheet', action='store_false',
                           help='Generate individual QR files instead of sheets')
-        output.add_argument('--sheet-size', type=int, metavar='N',
+        output.add_argument('--sheet-size', type=int, metavar='N', default=9,
                           help='QR codes per sheet (default: 9)')
-        output.add_argument('--sheet-cols', type=int, metavar='N', 
+        output.add_argument('--sheet-cols', type=int, metavar='N', default=3,
                           help='Columns per sheet (default: 3)')
-        
+
         # QR code appearance
         appearance = generate.add_argument_group('QR Code Options')
-        appearance.add_argument('--box-size', type=int, metavar='N',
+        appearance.add_argument('--box-size', type=int, metavar='N', default=10,
                               help='QR code pixel size (default: 10)')
-        appearance.add_argument('--border', type=int, metavar='N',
+        appearance.add_argument('--border', type=int, metavar='N', default=4,
                               help='QR code border size (default: 4)')
         
         # Performance options
@@ -232,12 +556,9 @@ Examples:
                             help='Auto-cleanup temporary files (legacy option)')
         behavior.add_argument('--force', action='store_true',
                             help='Skip confirmation for large numbers of QR codes')
-        behavior.add_argument('--display', choices=['viewer', 'cli', 'none'],
+        behavior.add_argument('--display', choices=['viewer', 'cli', 'none'], default='none',
                             help='How to display generated QR codes')
-        
-        # Output control
-        self.add_output_options(generate)
-        
+
         return generate
     
     def create_scan_parser(self, subparsers):
@@ -247,16 +568,9 @@ Examples:
             aliases=['s'],
             help='Scan QR code images to extract chunks (legacy - use "qr read" instead)', 
             description='Legacy command: Process QR code images to extract file chunks. For v2.0, use "qr read" which auto-detects and rebuilds.',
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
-Examples:
-  qr scan ./photos/                         # Scan all images in folder
-  qr scan ./images/ -o ./chunks/            # Custom output directory
-  qr scan ./qr_sheets/ --auto-rebuild       # Scan and auto-reconstruct files
-  qr scan ./mobile_photos/ --organized      # Create organized output structure
-  qr scan ./scans/ --pattern "*.png"        # Process only PNG files
-  qr scan ./photos/ --verbose               # Detailed scanning progress
-            """
+            formatter_class=_FMT,
+            epilog=_SCAN_EPILOG,
+            parents=[_common_parent(), _output_parent()]
         )
         
         # Required arguments
@@ -266,21 +580,11 @@ Examples:
         io_group = scan.add_argument_group('Input/Output Options')
         io_group.add_argument('--output', '-o', metavar='DIR',
                              help='Output directory for chunk files (default: ./scan_output/)')
-        io_group.add_argument('--pattern', metavar='GLOB',
-                             help='Image file pattern (e.g., "*.png", "sheet_*.jpg")')
-        io_group.add_argument('--recursive', '-r', action='store_true',
-                             help='Process subdirectories recursively')
-        
+
         # Workflow options
         workflow = scan.add_argument_group('Workflow Options')
-        workflow.add_argument('--organized', action='store_true', default=True,
-                             help='Create organized output structure (default: enabled)')
-        workflow.add_argument('--no-organized', dest='organized', action='store_false',
-                             help='Disable organized output structure')
         workflow.add_argument('--auto-rebuild', action='store_true',
                              help='Automatically reconstruct files after scanning')
-        workflow.add_argument('--auto-cleanup', action='store_true', default=True,
-                             help='Automatically cleanup temporary files (default: enabled)')
         workflow.add_argument('--scan-summary', action='store_true', default=True,
                              help='Generate scanning summary report (default: enabled)')
         
@@ -292,10 +596,7 @@ Examples:
                               help='Skip checksum verification')
         processing.add_argument('--max-errors', type=int, metavar='N', default=10,
                               help='Maximum scan errors before stopping (default: 10)')
-        
-        # Output control
-        self.add_output_options(scan)
-        
+
         return scan
     
     def create_rebuild_parser(self, subparsers):
@@ -305,17 +606,9 @@ Examples:
             aliases=['rb'],
             help='Rebuild files from scanned chunks (legacy - use "qr read" instead)',
             description='Legacy command: Reconstruct original files from QR code chunks. For v2.0, use "qr read" which auto-detects input type.',
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
-Examples:
-  qr rebuild ./scanned_chunks/              # Basic reconstruction
-  qr rebuild ./chunks/ --verify             # With integrity verification
-  qr rebuild ./chunks/ --encrypted          # Decrypt encrypted chunks
-  qr rebuild ./chunks/ --spaces             # Convert tabs to spaces
-  qr rebuild ./chunks/ -o ./restored/       # Organized output directory
-  qr rebuild ./chunks/ --organized          # Create organized output structure
-  qr rebuild ./chunks/ --batch              # Process multiple file sets
-            """
+            formatter_class=_FMT,
+            epilog=_REBUILD_EPILOG,
+            parents=[_common_parent(), _output_parent()]
         )
         
         # Required arguments
@@ -325,21 +618,11 @@ Examples:
         io_group = rebuild.add_argument_group('Input/Output Options')
         io_group.add_argument('--output-dir', '-o', metavar='DIR',
                              help='Output directory for reconstructed files (default: ./rebuild_output/)')
-        io_group.add_argument('--pattern', metavar='GLOB',
-                             help='Chunk file pattern (e.g., "chunk_*.txt")')
-        io_group.add_argument('--recursive', '-r', action='store_true',
-                             help='Process subdirectories recursively')
-        
+
         # Workflow options
         workflow = rebuild.add_argument_group('Workflow Options')
-        workflow.add_argument('--organized', action='store_true', default=True,
-                             help='Create organized output structure (default: enabled)')
-        workflow.add_argument('--no-organized', dest='organized', action='store_false',
-                             help='Disable organized output structure')
         workflow.add_argument('--batch', action='store_true',
                              help='Process multiple file sets in directory')
-        workflow.add_argument('--auto-cleanup', action='store_true', default=True,
-                             help='Automatically cleanup temporary files (default: enabled)')
         workflow.add_argument('--rebuild-summary', action='store_true', default=True,
                              help='Generate rebuild summary report (default: enabled)')
         
@@ -353,10 +636,7 @@ Examples:
                                   help='Convert tabs to spaces during reconstruction')
         reconstruction.add_argument('--suffix', metavar='STR',
                                   help='Add suffix to reconstructed filenames')
-        
-        # Output control
-        self.add_output_options(rebuild)
-        
+
         return rebuild
     
     def create_config_parser(self, subparsers):
@@ -366,13 +646,8 @@ Examples:
             aliases=['cfg'],
             help='Manage configuration settings',
             description='View and modify QR tool configuration settings',
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
-Examples:
-  qr config show                           # Display current settings
-  qr config reset                          # Reset to default settings
-  qr config --file ~/.qr-config.json      # Use custom config file
-            """
+            formatter_class=_FMT,
+            epilog=_CONFIG_EPILOG
         )
         
         # Config actions (mutually exclusive)
@@ -399,28 +674,9 @@ Examples:
             aliases=['r'],
             help='Read QR codes or chunks back to files (auto-detects input type)',
             description='Unified command to process QR images or chunk files back to original files with smart auto-detection',
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
-🚀 v2.0 Simplified Interface:
-  qr read ./photos/              # Auto-detects QR images, scans + rebuilds
-  qr read ./chunks/              # Auto-detects chunk files, rebuilds directly
-  qr read ./mixed_folder/        # Handles both images and chunks intelligently
-  qr read single_image.png       # Processes single QR image
-  qr read chunk_001.txt          # Processes single chunk file
-
-🔍 Auto-Detection Features:
-  • Automatically identifies QR images (.png, .jpg, .jpeg, .bmp, .tiff)
-  • Recognizes QR chunk files (.txt with QR headers)
-  • Handles mixed directories (both images and chunks)
-  • Auto-rebuild enabled by default for QR images
-  • Organized output structure with session timestamps
-
-🎯 Advanced Options:
-  qr read ./folder/ --mode scan-only     # Only scan, don't rebuild
-  qr read ./folder/ --mode rebuild-only  # Only rebuild from chunks
-  qr read ./folder/ --as-images          # Force treat as QR images
-  qr read ./folder/ --as-chunks          # Force treat as chunk files
-            """
+            formatter_class=_FMT,
+            epilog=_READ_EPILOG,
+            parents=[_common_parent(), _output_parent()]
         )
         
         # Required arguments
@@ -439,23 +695,13 @@ Examples:
         io_group = read.add_argument_group('Input/Output Options')
         io_group.add_argument('--output', '-o', metavar='DIR',
                              help='Output directory (default: ./read_output/)')
-        io_group.add_argument('--pattern', metavar='GLOB',
-                             help='File pattern filter (e.g., "*.png", "chunk_*.txt")')
-        io_group.add_argument('--recursive', '-r', action='store_true',
-                             help='Process subdirectories recursively')
-        
+
         # Workflow options
         workflow = read.add_argument_group('Workflow Options')
-        workflow.add_argument('--organized', action='store_true', default=True,
-                             help='Create organized output structure (default: enabled)')
-        workflow.add_argument('--no-organized', dest='organized', action='store_false',
-                             help='Disable organized output structure')
         workflow.add_argument('--auto-rebuild', action='store_true', default=True,
                              help='Auto-rebuild files after scanning (default: enabled)')
         workflow.add_argument('--no-auto-rebuild', dest='auto_rebuild', action='store_false',
                              help='Only scan QR codes, do not rebuild files')
-        workflow.add_argument('--auto-cleanup', action='store_true', default=True,
-                             help='Automatically cleanup temporary files (default: enabled)')
         workflow.add_argument('--read-summary', action='store_true', default=True,
                              help='Generate read processing summary (default: enabled)')
         
@@ -471,76 +717,102 @@ Examples:
                                help='Convert tabs to spaces during reconstruction')
         processing.add_argument('--max-errors', type=int, metavar='N', default=10,
                                help='Maximum processing errors before stopping (default: 10)')
-        
-        # Output control
-        self.add_output_options(read)
-        
+
         return read
-    
-    def add_output_options(self, parser):
-        """Add common output control options"""
-        output = parser.add_argument_group('Output Control')
-        output.add_argument('--verbose', '-v', action='store_true',
-                          help='Verbose output with detailed progress')
-        output.add_argument('--quiet', '-q', action='store_true',
-                          help='Quiet mode (minimal output)')
-        output.add_argument('--no-progress', action='store_true',
-                          help='Disable progress bars')
-        output.add_argument('--no-emoji', action='store_true',
-                          help='Disable emoji in output (for compatibility)')
-    
-    def discover_files(self, input_path, pattern=None, recursive=False):
-        """Discover files for processing based on input path and options"""
-        files = []
-        
-        if os.path.isfile(input_path):
+
+    def _buffered_print(self, text):
+        """Queue a progress line; batches flush as one write instead of a
+        syscall per file in the hot loops"""
+        self._out_buf.append(text)
+        if (len(self._out_buf) >= self._FLUSH_EVERY
+                or time.monotonic() - self._out_last_flush >= self._FLUSH_INTERVAL):
+            self._flush_output()
+
+    def _flush_output(self):
+        """Write any queued progress lines in a single print"""
+        if self._out_buf:
+            self._safe_print_many(self._out_buf)
+            self._out_buf.clear()
+        self._out_last_flush = time.monotonic()
+
+    def discover_files(self, input_path, pattern=None, recursive=False, sort=True):
+        """Discover files for processing based on input path and options
+
+        With sort=False the paths are streamed as the directory walk yields
+        them, so callers that don't need a stable order can start processing
+        before discovery finishes.
+        """
+        # Single stat, then mode inspection - os.path.isfile + os.path.isdir
+        # would hit the filesystem twice for the common directory case
+        try:
+            mode = os.stat(input_path).st_mode
+        except OSError:
+            raise FileNotFoundError(f"Input path not found: {input_path}")
+
+        if stat.S_ISREG(mode):
             # Single file
-            files.append(input_path)
-        elif os.path.isdir(input_path):
-            # Directory - discover files
-            import glob
-            from pathlib import Path
-            
-            input_dir = Path(input_path)
-            
-            if pattern:
-                # Use provided pattern
-                search_pattern = pattern
-            else:
-                # Default patterns for common file types
-                search_pattern = "*"
-            
-            if recursive:
-                # Recursive search
-                search_path = input_dir / "**" / search_pattern
-                files.extend(glob.glob(str(search_path), recursive=True))
-            else:
-                # Non-recursive search
-                search_path = input_dir / search_pattern
-                files.extend(glob.glob(str(search_path)))
-            
-            # Filter out directories from results
-            files = [f for f in files if os.path.isfile(f)]
-            
-            # Sort for consistent processing order
-            files.sort()
-        else:
+            return [input_path]
+
+        if not stat.S_ISDIR(mode):
             raise FileNotFoundError(f"Input path not found: {input_path}")
-        
-        return files
+
+        # Directory - walk with os.scandir so each DirEntry carries its file
+        # type from the directory read, avoiding a second stat per entry.
+        # Patterns match basenames only (fnmatch, not glob), so a --pattern
+        # containing '/' selects nothing; use --recursive to span directories.
+        search_pattern = pattern or "*"
+        # Like glob, the default discovery never matches hidden entries -
+        # silently QR-encoding .env or .gitignore would be a nasty surprise.
+        # An explicit --pattern can still opt in to them.
+        skip_hidden = pattern is None
+
+        def _walk(root):
+            # Iterative breadth-first walk - no generator-per-subdirectory
+            # recursion, and symlinked dirs are never followed so cycles
+            # can't loop the traversal. VCS/tool internals and our own
+            # output trees are pruned before descent.
+            queue = deque((root,))
+            while queue:
+                try:
+                    entries = os.scandir(queue.popleft())
+                except OSError:
+                    # Unreadable directory - skip it like glob did rather
+                    # than abort a walk that may already be mid-stream
+                    continue
+                with entries:
+                    for entry in entries:
+                        if skip_hidden and entry.name.startswith('.'):
+                            continue
+                        if entry.is_file(follow_symlinks=False):
+                            if fnmatch.fnmatch(entry.name, search_pattern):
+                                yield entry.path
+                        elif (recursive and entry.name not in _SKIP_DIRS
+                                and entry.is_dir(follow_symlinks=False)):
+                            queue.append(entry.path)
+
+        if not sort:
+            return _walk(input_path)
+
+        # Sort for consistent processing order
+        return sorted(_walk(input_path))
     
-    def create_organized_output_structure(self, output_dir, input_path, preserve_structure=False):
+    def create_organized_output_structure(self, output_dir, input_path, preserve_structure=False, input_is_file=None, timestamp=None):
         """Create organized output directory structure"""
-        import datetime
-        from pathlib import Path
-        
+
         # Create base output directory
         output_path = Path(output_dir)
-        
-        # Create timestamp-based session directory for organization
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        if os.path.isfile(input_path):
+
+        # Timestamp-based session directory for organization. Callers that
+        # create several structures in one run pass a shared timestamp so the
+        # whole batch lands in one session even if the clock ticks mid-run.
+        if timestamp is None:
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        # Callers that already know the input type pass it in to avoid a re-stat
+        if input_is_file is None:
+            input_is_file = os.path.isfile(input_path)
+
+        if input_is_file:
             # Single file - create session directory
             session_name = f"{Path(input_path).stem}_{timestamp}"
             session_dir = output_path / session_name
@@ -550,19 +822,16 @@ Examples:
             session_name = f"{input_name}_batch_{timestamp}"
             session_dir = output_path / session_name
         
-        # Create directory structure
+        # Create the session directory only; the qr_codes/ and reports/
+        # subdirectories are made on first write (run_generate creates each
+        # file's target dir, generate_batch_summary creates reports/), so
+        # small jobs don't leave empty folders behind
         session_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Create subdirectories for organization
-        (session_dir / "qr_codes").mkdir(exist_ok=True)
-        (session_dir / "sheets").mkdir(exist_ok=True)
-        (session_dir / "reports").mkdir(exist_ok=True)
-        
+
         return session_dir
     
     def get_relative_output_path(self, file_path, input_base, output_base, preserve_structure=False):
         """Get the output path for a file, optionally preserving directory structure"""
-        from pathlib import Path
         
         if not preserve_structure:
             # Flat structure - just filename
@@ -575,10 +844,33 @@ Examples:
     
     def generate_batch_summary(self, processed_files, output_dir, total_time):
         """Generate a comprehensive batch processing summary"""
-        import json
-        import datetime
-        from pathlib import Path
         
+        statistics = {
+            "total_qr_codes": 0,
+            "total_sheets": 0,
+            "encrypted_files": 0,
+            "failed_files": 0,
+            "average_qr_codes_per_file": 0
+        }
+
+        # Single pass over processed_files: accumulate stats and the success
+        # count together instead of re-scanning the list for averages
+        successful_files = 0
+        for file_info in processed_files:
+            if file_info.success:
+                successful_files += 1
+                statistics["total_qr_codes"] += file_info.qr_count
+                statistics["total_sheets"] += file_info.sheet_count
+                if file_info.encrypted:
+                    statistics["encrypted_files"] += 1
+            else:
+                statistics["failed_files"] += 1
+
+        if successful_files > 0:
+            statistics["average_qr_codes_per_file"] = round(
+                statistics["total_qr_codes"] / successful_files, 1
+            )
+
         summary = {
             "batch_info": {
                 "timestamp": datetime.datetime.now().isoformat(),
@@ -586,47 +878,22 @@ Examples:
                 "total_time_seconds": round(total_time, 2),
                 "output_directory": str(output_dir)
             },
-            "files": [],
-            "statistics": {
-                "total_qr_codes": 0,
-                "total_sheets": 0,
-                "encrypted_files": 0,
-                "failed_files": 0,
-                "average_qr_codes_per_file": 0
-            }
+            "files": [file_info.as_dict() for file_info in processed_files],
+            "statistics": statistics
         }
         
-        for file_info in processed_files:
-            summary["files"].append(file_info)
-            if file_info.get("success", False):
-                summary["statistics"]["total_qr_codes"] += file_info.get("qr_count", 0)
-                summary["statistics"]["total_sheets"] += file_info.get("sheet_count", 0)
-                if file_info.get("encrypted", False):
-                    summary["statistics"]["encrypted_files"] += 1
-            else:
-                summary["statistics"]["failed_files"] += 1
-        
-        # Calculate averages
-        successful_files = len([f for f in processed_files if f.get("success", False)])
-        if successful_files > 0:
-            summary["statistics"]["average_qr_codes_per_file"] = round(
-                summary["statistics"]["total_qr_codes"] / successful_files, 1
-            )
-        
         # Save summary report
         reports_dir = Path(output_dir) / "reports"
         reports_dir.mkdir(exist_ok=True)
         summary_file = reports_dir / "batch_summary.json"
         
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
-        
+        summary_file.write_bytes(_dump_json_bytes(summary))
+
         return summary_file, summary
     
     def _cleanup_organized_output(self, session_output_dir, quiet=False):
         """Clean up organized output directory with 30-second viewing window"""
         import shutil
-        import time
         
         if not session_output_dir.exists():
             return
@@ -662,29 +929,60 @@ Examples:
 
     def run_generate(self, args):
         """Execute generate command with folder support"""
-        import time
-        from pathlib import Path
-        
-        # Validate input exists
-        if not os.path.exists(args.input):
-            self._safe_print(f"❌ Error: Input not found: {args.input}")
+
+        # Check encryption dependencies with a cheap spec probe before
+        # paying for the qr_enhanced import chain (PIL/qrcode/cryptography)
+        if args.encrypt:
+            import importlib.util
+            if importlib.util.find_spec('cryptography') is None:
+                self._safe_print("❌ Error: Encryption requires 'cryptography' library")
+                self._safe_print("   Install with: pip install cryptography")
+                return 1
+
+        try:
+            from qr_enhanced import QRTransferTool
+        except ImportError as e:
+            self._safe_print(f"❌ Error importing modules: {e}")
+            self._safe_print("   Make sure all QR tool files are in the same directory")
             return 1
-        
-        # Check encryption dependencies
-        if args.encrypt and not HAS_CRYPTO:
-            self._safe_print("❌ Error: Encryption requires 'cryptography' library")
-            self._safe_print("   Install with: pip install cryptography")
+
+        # Snapshot the namespace once - dict lookups beat repeated
+        # getattr-with-default calls on the hot paths below
+        opts = vars(args)
+        organized = opts.get('organized', True)
+        auto_cleanup = opts.get('auto_cleanup', True)
+
+        # Absolutize the root once up front; discover_files then yields
+        # absolute entry paths for free instead of the old per-file abspath
+        # pass (each of which issued its own getcwd)
+        input_root = os.path.abspath(args.input)
+
+        # Validate input exists - stat once and reuse the result below instead
+        # of re-checking the path with exists/isdir/isfile
+        try:
+            input_is_dir = stat.S_ISDIR(os.stat(input_root).st_mode)
+        except OSError:
+            self._safe_print(f"❌ Error: Input not found: {args.input}")
             return 1
-        
-        # Discover files to process
+
+        # Discover files to process. The first _EAGER_BATCH_LIMIT paths are
+        # pulled eagerly (covers the empty check and plan display); any
+        # remainder stays a lazy generator that the parallel path consumes
+        # while the walk is still running.
         try:
-            files_to_process = self.discover_files(
-                args.input, 
-                getattr(args, 'pattern', None),
-                getattr(args, 'recursive', False)
+            files_iter = self.discover_files(
+                input_root,
+                opts.get('pattern'),
+                opts.get('recursive', False),
+                sort=False
             )
-            # Convert to absolute paths to avoid issues with directory changes
-            files_to_process = [os.path.abspath(f) for f in files_to_process]
+            if isinstance(files_iter, list):
+                files_to_process = files_iter
+                files_tail = None
+            else:
+                files_to_process = list(itertools.islice(files_iter, _EAGER_BATCH_LIMIT))
+                files_tail = files_iter if len(files_to_process) == _EAGER_BATCH_LIMIT else None
+                files_to_process.sort()
         except Exception as e:
             self._safe_print(f"❌ Error discovering files: {e}")
             return 1
@@ -693,35 +991,42 @@ Examples:
             self._safe_print(f"❌ No files found to process in: {args.input}")
             return 1
         
+        # One wall-clock sample per run - every organized structure created
+        # for this invocation shares the same session timestamp
+        session_ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+
         # Set up output directory
-        if getattr(args, 'organized', True):
+        if organized:
             # Create organized output structure
-            output_base_dir = getattr(args, 'output_dir', None) or "./qr_output"
+            output_base_dir = opts.get('output_dir') or "./qr_output"
             try:
                 session_output_dir = self.create_organized_output_structure(
-                    output_base_dir, 
-                    args.input,
-                    getattr(args, 'preserve_structure', False)
+                    output_base_dir,
+                    input_root,
+                    opts.get('preserve_structure', False),
+                    input_is_file=not input_is_dir,
+                    timestamp=session_ts
                 )
             except Exception as e:
                 self._safe_print(f"❌ Error creating output structure: {e}")
                 return 1
         else:
             # Simple output to current directory or specified directory
-            session_output_dir = Path(getattr(args, 'output_dir', "."))
+            session_output_dir = Path(opts.get('output_dir') or ".")
             session_output_dir.mkdir(parents=True, exist_ok=True)
         
         # Display processing plan
-        verbose = getattr(args, 'verbose', False)
-        quiet = getattr(args, 'quiet', False)
+        verbose = opts.get('verbose', False)
+        quiet = opts.get('quiet', False)
         
         if not quiet:
-            is_folder = os.path.isdir(args.input)
+            is_folder = input_is_dir
             encryption_note = " with AES-256 encryption" if args.encrypt else ""
-            sheet_note = " as sheets" if getattr(args, 'sheet', False) else ""
+            sheet_note = " as sheets" if opts.get('sheet', False) else ""
             
             if is_folder:
-                self._safe_print(f"📁 Batch processing {len(files_to_process)} file(s){sheet_note}{encryption_note}")
+                count_note = str(len(files_to_process)) if files_tail is None else f"{len(files_to_process)}+"
+                self._safe_print(f"📁 Batch processing {count_note} file(s){sheet_note}{encryption_note}")
                 self._safe_print(f"📂 Input: {args.input}")
             else:
                 self._safe_print(f"🎯 Generating QR codes{sheet_note}{encryption_note} for: {args.input}")
@@ -729,104 +1034,63 @@ Examples:
             self._safe_print(f"📁 Output: {session_output_dir}")
             
             if verbose and len(files_to_process) > 1:
-                self._safe_print(f"\n📋 Files to process:")
-                for i, file_path in enumerate(files_to_process[:10], 1):  # Show first 10
-                    self._safe_print(f"  {i:2d}. {Path(file_path).name}")
+                preview = [f"\n📋 Files to process:"]
+                preview.extend(
+                    f"  {i:2d}. {os.path.basename(file_path)}"
+                    for i, file_path in enumerate(files_to_process[:10], 1)  # Show first 10
+                )
                 if len(files_to_process) > 10:
-                    self._safe_print(f"  ... and {len(files_to_process) - 10} more files")
-                self._safe_print("")
-        
+                    preview.append(f"  ... and {len(files_to_process) - 10} more files")
+                preview.append("")
+                self._safe_print_many(preview)
+        
+        # For encrypted batches, prompt for the password once and share a
+        # single QRCrypto so the PBKDF2 key derivation isn't repeated per file
+        encryption_password = None
+        shared_crypto = None
+        if args.encrypt:
+            from qr_enhanced import QRCrypto, get_encryption_password
+            encryption_password = get_encryption_password()
+            shared_crypto = QRCrypto()
+
         # Process files
         processed_files = []
         start_time = time.time()
         successful_count = 0
-        
-        for i, file_path in enumerate(files_to_process, 1):
-            if not quiet:
-                progress_msg = f"[{i}/{len(files_to_process)}]" if len(files_to_process) > 1 else ""
-                self._safe_print(f"🔄 {progress_msg} Processing: {Path(file_path).name}")
-            
-            file_start_time = time.time()
-            file_info = {
-                "file_path": file_path,
-                "file_name": Path(file_path).name,
-                "success": False,
-                "qr_count": 0,
-                "sheet_count": 0,
-                "encrypted": args.encrypt,
-                "processing_time": 0,
-                "error": None
-            }
-            
-            try:
-                # Set up arguments for QRTransferTool
-                tool_args = argparse.Namespace()
-                
-                # Copy over relevant arguments with defaults
-                tool_args.file = file_path
-                tool_args.encrypt = getattr(args, 'encrypt', False)
-                tool_args.sheet = getattr(args, 'sheet', True)  # Default to sheet mode
-                tool_args.sheet_size = getattr(args, 'sheet_size', None) or 9
-                tool_args.sheet_cols = getattr(args, 'sheet_cols', None) or 3
-                tool_args.box_size = getattr(args, 'box_size', None) or 10
-                tool_args.border = getattr(args, 'border', None) or 4
-                tool_args.force = getattr(args, 'force', False)
-                tool_args.display = getattr(args, 'display', 'none')
-                tool_args.verbose = verbose and len(files_to_process) == 1  # Only verbose for single files
-                tool_args.quiet = quiet or len(files_to_process) > 1  # Quiet for batch processing
-                tool_args.no_parallel = getattr(args, 'no_parallel', False)
-                
-                # Disable cleanup in individual tools - we'll handle it centrally
-                tool_args.cleanup = False
-                
-                # Override working directory for organized output
-                if getattr(args, 'organized', True):
-                    original_cwd = os.getcwd()
-                    target_output_dir = self.get_relative_output_path(
-                        file_path, args.input, session_output_dir, 
-                        getattr(args, 'preserve_structure', False)
-                    ).parent
-                    target_output_dir.mkdir(parents=True, exist_ok=True)
-                    os.chdir(target_output_dir)
-                
-                # Process the file
-                with QRTransferTool(tool_args) as tool:
-                    tool.process_file(file_path)
-                
-                # Restore working directory
-                if getattr(args, 'organized', True):
-                    os.chdir(original_cwd)
-                
-                file_info["success"] = True
-                file_info["processing_time"] = round(time.time() - file_start_time, 2)
-                successful_count += 1
-                
-                if verbose or (not quiet and len(files_to_process) == 1):
-                    self._safe_print(f"  ✅ Generated QR codes for {Path(file_path).name}")
-                
-            except KeyboardInterrupt:
-                if getattr(args, 'organized', True):
-                    os.chdir(original_cwd)
-                self._safe_print("\n⏹️  Operation cancelled by user")
+
+        # QR encoding is CPU-bound, so multi-file batches fan out across
+        # worker processes unless --no-parallel asked for serial processing
+        # or the pool would only get one worker anyway
+        pool_size = args.max_workers or os.cpu_count() or 1
+        if not args.no_parallel and pool_size > 1 and (len(files_to_process) > 1 or files_tail):
+            files_stream = files_to_process if files_tail is None \
+                else itertools.chain(files_to_process, files_tail)
+            result = self._generate_parallel(
+                args, opts, files_stream, input_root, session_output_dir,
+                encryption_password, organized, quiet
+            )
+            if result is None:
                 return 1
-            except Exception as e:
-                if getattr(args, 'organized', True):
-                    os.chdir(original_cwd)
-                file_info["error"] = str(e)
-                file_info["processing_time"] = round(time.time() - file_start_time, 2)
-                
-                if verbose:
-                    self._safe_print(f"  ❌ Failed to process {Path(file_path).name}: {e}")
-                elif not quiet:
-                    self._safe_print(f"  ❌ Failed: {Path(file_path).name}")
-            
-            processed_files.append(file_info)
-        
+            processed_files, successful_count = result
+        else:
+            if files_tail is not None:
+                # Serial processing needs the full sorted list
+                files_to_process.extend(files_tail)
+                files_to_process.sort()
+            successful_count = self._generate_serial(
+                args, opts, files_to_process, input_root, session_output_dir,
+                encryption_password, shared_crypto, organized,
+                verbose, quiet, processed_files
+            )
+            if successful_count is None:
+                return 1
+
         total_time = time.time() - start_time
-        
+        total_files = len(processed_files)
+
         # Generate batch summary if requested
         summary_file = None
-        if getattr(args, 'batch_summary', True) and len(files_to_process) > 1:
+        if opts.get('batch_summary', True) and total_files > 1:
             try:
                 summary_file, summary = self.generate_batch_summary(processed_files, session_output_dir, total_time)
                 if verbose:
@@ -834,61 +1098,247 @@ Examples:
             except Exception as e:
                 if verbose:
                     self._safe_print(f"⚠️  Could not generate batch summary: {e}")
-        
+
         # Optional cleanup of organized output directory
-        if getattr(args, 'auto_cleanup', True) and successful_count > 0:
+        if auto_cleanup and successful_count > 0:
             self._cleanup_organized_output(session_output_dir, quiet)
-        
+
         # Final summary
         if not quiet:
-            self._safe_print(f"\n{'='*60}")
-            if len(files_to_process) > 1:
-                failed_count = len(files_to_process) - successful_count
-                self._safe_print(f"📊 Batch processing completed: {successful_count}/{len(files_to_process)} files successful")
+            summary_lines = [f"\n{'='*60}"]
+            if total_files > 1:
+                failed_count = total_files - successful_count
+                summary_lines.append(f"📊 Batch processing completed: {successful_count}/{total_files} files successful")
                 if failed_count > 0:
-                    self._safe_print(f"❌ Failed files: {failed_count}")
-                self._safe_print(f"⏱️  Total time: {total_time:.1f}s")
+                    summary_lines.append(f"❌ Failed files: {failed_count}")
+                summary_lines.append(f"⏱️  Total time: {total_time:.1f}s")
                 if summary_file:
                     try:
                         rel_path = summary_file.relative_to(Path.cwd())
-                        self._safe_print(f"📋 Detailed report: {rel_path}")
+                        summary_lines.append(f"📋 Detailed report: {rel_path}")
                     except ValueError:
-                        self._safe_print(f"📋 Detailed report: {summary_file}")
+                        summary_lines.append(f"📋 Detailed report: {summary_file}")
             else:
-                self._safe_print(f"✅ QR code generation completed successfully")
-            
-            if not getattr(args, 'auto_cleanup', True):
-                self._safe_print(f"📁 Output location: {session_output_dir}")
-                if getattr(args, 'organized', True):
-                    self._safe_print(f"   📂 QR codes: {session_output_dir / 'qr_codes'}")
-                    if getattr(args, 'sheet', False):
-                        self._safe_print(f"   📄 Sheets: {session_output_dir / 'sheets'}")
-                    self._safe_print(f"   📊 Reports: {session_output_dir / 'reports'}")
-        
-        return 0 if successful_count == len(files_to_process) else 1
+                summary_lines.append(f"✅ QR code generation completed successfully")
+
+            if not auto_cleanup:
+                summary_lines.append(f"📁 Output location: {session_output_dir}")
+                if organized:
+                    summary_lines.append(f"   📂 QR codes: {session_output_dir / 'qr_codes'}")
+                    if opts.get('sheet', False):
+                        summary_lines.append(f"   📄 Sheets: {session_output_dir / 'sheets'}")
+                    summary_lines.append(f"   📊 Reports: {session_output_dir / 'reports'}")
+            self._safe_print_many(summary_lines)
+
+        return 0 if successful_count == total_files else 1
+
+    def _generate_parallel(self, args, opts, files_stream, input_root,
+                           session_output_dir, encryption_password, organized, quiet):
+        """Fan a batch out across a ProcessPoolExecutor
+
+        files_stream may be a list or a lazy discovery generator; submission
+        consumes it incrementally so processing overlaps the walk. Returns
+        (processed_files, successful_count), or None on interrupt.
+        """
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        # Workers run one file each, so the per-file tool is forced serial
+        # (quiet, no nested parallelism) and output dirs are created up front
+        tool_opts = {
+            'encrypt': args.encrypt,
+            'sheet': args.sheet,
+            'sheet_size': args.sheet_size,
+            'sheet_cols': args.sheet_cols,
+            'box_size': args.box_size,
+            'border': args.border,
+            'force': args.force,
+            'display': args.display,
+            'verbose': False,
+            'quiet': True,
+            'no_parallel': True,
+            'cleanup': False,
+        }
+
+        # Target dirs only vary with the source directory, so resolve and
+        # mkdir once per distinct dir instead of once per file
+        dir_cache = {}
+        preserve_structure = opts.get('preserve_structure', False)
+
+        successful_count = 0
+        try:
+            with ProcessPoolExecutor(max_workers=args.max_workers or os.cpu_count()) as executor:
+                # files_stream may still be walking the input tree; workers
+                # start on the first submission, so QR encoding overlaps the
+                # rest of the discovery I/O
+                future_index = {}
+                for i, file_path in enumerate(files_stream):
+                    target_dir = None
+                    if organized:
+                        src_dir = os.path.dirname(file_path)
+                        target_dir = dir_cache.get(src_dir)
+                        if target_dir is None:
+                            target_path = self.get_relative_output_path(
+                                file_path, input_root, session_output_dir,
+                                preserve_structure
+                            ).parent
+                            target_path.mkdir(parents=True, exist_ok=True)
+                            target_dir = dir_cache[src_dir] = str(target_path)
+                    future_index[executor.submit(_generate_worker, {
+                        'file_path': file_path,
+                        'target_dir': target_dir,
+                        'tool_opts': tool_opts,
+                        'encryption_password': encryption_password,
+                    })] = i
+
+                total = len(future_index)
+                results = [None] * total
+                for done, future in enumerate(as_completed(future_index), 1):
+                    i = future_index[future]
+                    file_info = results[i] = future.result()
+                    if file_info.success:
+                        successful_count += 1
+                    if not quiet:
+                        status = "✅" if file_info.success else "❌"
+                        self._buffered_print(f"{status} [{done}/{total}] {file_info.file_name}")
+        except KeyboardInterrupt:
+            self._flush_output()
+            self._safe_print("\n⏹️  Operation cancelled by user")
+            return None
+
+        self._flush_output()
+        return results, successful_count
+
+    def _generate_serial(self, args, opts, files_to_process, input_root,
+                         session_output_dir, encryption_password, shared_crypto,
+                         organized, verbose, quiet, processed_files):
+        """Process files one at a time in this process
+
+        Fills processed_files with per-file results and returns the success
+        count, or None on interrupt.
+        """
+        # run_generate already probed the import and reported any failure;
+        # it was a local there, so bind it in this scope too
+        from qr_enhanced import QRTransferTool
+
+        successful_count = 0
+        dir_cache = {}
+        total = len(files_to_process)
+
+        # Fill a pre-sized list by index - no append reallocs as the batch
+        # grows (on interrupt the partial list is discarded by the caller)
+        processed_files[:] = [None] * total
+
+        # Everything but the file path and output dir is constant across the
+        # batch, so build the QRTransferTool args once and shallow-copy per
+        # file instead of re-running a dozen Namespace attribute assignments
+        tool_args_tpl = argparse.Namespace(
+            file=None,
+            output_dir=None,
+            encrypt=args.encrypt,
+            sheet=args.sheet,
+            sheet_size=args.sheet_size,
+            sheet_cols=args.sheet_cols,
+            box_size=args.box_size,
+            border=args.border,
+            force=args.force,
+            display=args.display,
+            verbose=verbose and total == 1,  # Only verbose for single files
+            quiet=quiet or total > 1,  # Quiet for batch processing
+            no_parallel=args.no_parallel,
+            # Disable cleanup in individual tools - we'll handle it centrally
+            cleanup=False,
+        )
+
+        for i, file_path in enumerate(files_to_process, 1):
+            # One basename per file - the progress line, info dict and
+            # outcome messages all reuse it instead of re-parsing a Path
+            file_name = os.path.basename(file_path)
+
+            if not quiet:
+                progress_msg = f"[{i}/{total}]" if total > 1 else ""
+                self._buffered_print(f"🔄 {progress_msg} Processing: {file_name}")
+
+            file_start_time = time.time()
+            file_info = _FileInfo(file_path, file_name, encrypted=args.encrypt)
+
+            try:
+                # Explicit per-file output dir instead of a chdir dance -
+                # no process-global cwd mutation, nothing to restore on
+                # error - resolved and mkdir'ed once per source directory
+                target_output_dir = None
+                if organized:
+                    src_dir = os.path.dirname(file_path)
+                    target_output_dir = dir_cache.get(src_dir)
+                    if target_output_dir is None:
+                        target_path = self.get_relative_output_path(
+                            file_path, input_root, session_output_dir,
+                            opts.get('preserve_structure', False)
+                        ).parent
+                        target_path.mkdir(parents=True, exist_ok=True)
+                        target_output_dir = dir_cache[src_dir] = str(target_path)
+
+                # Only the two per-file fields change on the template copy
+                tool_args = copy.copy(tool_args_tpl)
+                tool_args.file = file_path
+                tool_args.output_dir = target_output_dir
+
+                # Process the file
+                with QRTransferTool(tool_args) as tool:
+                    if args.encrypt:
+                        tool.encryption_password = encryption_password
+                        tool.crypto = shared_crypto
+                    tool.process_file(file_path)
+
+                file_info.success = True
+                file_info.processing_time = round(time.time() - file_start_time, 2)
+                successful_count += 1
+
+                if verbose or (not quiet and total == 1):
+                    self._buffered_print(f"  ✅ Generated QR codes for {file_name}")
+
+            except KeyboardInterrupt:
+                self._flush_output()
+                self._safe_print("\n⏹️  Operation cancelled by user")
+                return None
+            except Exception as e:
+                file_info.error = str(e)
+                file_info.processing_time = round(time.time() - file_start_time, 2)
+
+                if verbose:
+                    self._buffered_print(f"  ❌ Failed to process {file_name}: {e}")
+                elif not quiet:
+                    self._buffered_print(f"  ❌ Failed: {file_name}")
+
+            processed_files[i - 1] = file_info
+
+        self._flush_output()
+        return successful_count
     
     def run_scan(self, args):
         """Execute scan command"""
-        from pathlib import Path
-        
-        # Validate input exists
-        if not os.path.exists(args.input):
+
+        try:
+            from qr_scan import QRBatchScanner
+        except ImportError as e:
+            self._safe_print(f"❌ Error importing modules: {e}")
+            self._safe_print("   Make sure all QR tool files are in the same directory")
+            return 1
+
+        # Validate input exists - stat once and reuse the result below
+        try:
+            input_is_file = stat.S_ISREG(os.stat(args.input).st_mode)
+        except OSError:
             self._safe_print(f"❌ Error: Input not found: {args.input}")
             return 1
-        
-        # Set up arguments for QRBatchScanner  
+
+        # Set up arguments for QRBatchScanner
         scanner_args = argparse.Namespace()
         scanner_args.input_dir = args.input  # QRBatchScanner still expects input_dir
         scanner_args.output = args.output
         scanner_args.auto_reconstruct = getattr(args, 'auto_reconstruct', False)
         scanner_args.verbose = getattr(args, 'verbose', False)
         scanner_args.quiet = getattr(args, 'quiet', False)
-        
-        # Validate argument conflicts
-        if scanner_args.quiet and scanner_args.verbose:
-            self._safe_print("❌ Error: Cannot use --quiet and --verbose together")
-            return 1
-        
+
         try:
             if not scanner_args.quiet:
                 auto_note = " with auto-reconstruction" if scanner_args.auto_reconstruct else ""
@@ -897,7 +1347,7 @@ Examples:
             scanner = QRBatchScanner(scanner_args)
             
             # Process images (handle both files and directories)
-            if os.path.isfile(args.input):
+            if input_is_file:
                 # Single file - process directly
                 if not scanner_args.quiet:
                     self._safe_print(f"📷 Processing single QR image: {Path(args.input).name}")
@@ -948,10 +1398,9 @@ Examples:
             self._safe_print("\n⏹️  Operation cancelled by user")
             return 1
         except Exception as e:
-            self._safe_print(f"❌ Error: {e}")
+            _print_error(e)
             if getattr(args, 'verbose', False):
-                import traceback
-                traceback.print_exc()
+                _print_traceback()
             return 1
         
         return 0
@@ -966,43 +1415,30 @@ Examples:
         try:
             verbose = getattr(args, 'verbose', False)
             quiet = getattr(args, 'quiet', False)
-            
-            # Validate argument conflicts
-            if quiet and verbose:
-                self._safe_print("❌ Error: Cannot use --quiet and --verbose together")
-                return 1
-            
+
             if not quiet:
                 reconstruction_type = "encrypted " if getattr(args, 'encrypted', False) else ""
                 verification_note = " with verification" if getattr(args, 'verify', False) else ""
                 self._safe_print(f"🔄 Rebuilding {reconstruction_type}files{verification_note} from: {args.input}")
             
-            # Choose appropriate reconstruction method
-            if getattr(args, 'encrypted', False):
-                # Use encrypted reconstruction
-                import qr_rebuild_encrypted
-                sys.argv = ['qr_rebuild_encrypted.py', args.input]
-                if getattr(args, 'output_dir'):
-                    sys.argv.extend(['--output', args.output_dir])
-                qr_rebuild_encrypted.main()
-                
-            elif getattr(args, 'verify', False):
-                # Use verified reconstruction
-                import qr_rebuild_verified
-                sys.argv = ['qr_rebuild_verified.py', args.input]
-                qr_rebuild_verified.main()
-                
-            elif getattr(args, 'spaces', False):
-                # Use spaces reconstruction
-                import qr_rebuild_spaces
-                sys.argv = ['qr_rebuild_spaces.py', args.input]
-                qr_rebuild_spaces.main()
-                
-            else:
-                # Use basic reconstruction
-                sys.argv = ['qr_rebuild.py', args.input]
-                qr_rebuild.main()
-            
+            # Choose appropriate reconstruction method from the dispatch
+            # table (direct calls, no argv round-trips; modules cached after
+            # the first import)
+            for flag, module_name, output_kw in _REBUILD_MODES:
+                if flag is None or getattr(args, flag, False):
+                    kwargs = {}
+                    if output_kw:
+                        kwargs[output_kw] = getattr(args, 'output_dir', None)
+                    result = _rebuild_module(module_name).rebuild(args.input, **kwargs)
+                    break
+
+            # Every rebuild() variant returns falsy (None/False) when it
+            # couldn't reconstruct anything - surface that as a failure
+            # instead of the old sys.exit(1) the modules used under argv
+            if not result:
+                self._safe_print("❌ File reconstruction failed")
+                return 1
+
             if not quiet:
                 self._safe_print("✅ File reconstruction completed successfully")
                 
@@ -1010,76 +1446,84 @@ Examples:
             self._safe_print("\n⏹️  Operation cancelled by user")
             return 1
         except Exception as e:
-            self._safe_print(f"❌ Error: {e}")
+            _print_error(e)
             if getattr(args, 'verbose', False):
-                import traceback
-                traceback.print_exc()
+                _print_traceback()
             return 1
         
         return 0
     
+    # Config action → handler method dispatch table (see COMMAND_HANDLERS)
+    CONFIG_ACTIONS = {
+        'show': '_config_show',
+        'reset': '_config_reset',
+        'sample': '_config_sample',
+    }
+
+    def _config_show(self, config):
+        config.print_config()
+        return 0
+
+    def _config_reset(self, config):
+        config.reset_to_defaults()
+        if config.save_config():
+            self._safe_print("✅ Configuration reset to defaults")
+            return 0
+        self._safe_print("❌ Failed to save configuration")
+        return 1
+
+    def _config_sample(self, config):
+        sample_path = config.create_sample_config()
+        if sample_path:
+            self._safe_print(f"✅ Sample configuration created: {sample_path}")
+            return 0
+        self._safe_print("❌ Failed to create sample configuration")
+        return 1
+
     def run_config(self, args):
         """Execute config command"""
         try:
+            from qr_config import QRConfig
             config = QRConfig(getattr(args, 'file', None))
-            
-            # Determine action
+
+            # Determine action once: positional wins, then the first set flag,
+            # defaulting to 'show'
             action = getattr(args, 'action', None)
-            if getattr(args, 'show', False):
-                action = 'show'
-            elif getattr(args, 'reset', False):
-                action = 'reset'
-            elif getattr(args, 'sample', False):
-                action = 'sample'
-            
-            if action == 'show' or action is None:
-                config.print_config()
-                
-            elif action == 'reset':
-                config.reset_to_defaults()
-                if config.save_config():
-                    self._safe_print("✅ Configuration reset to defaults")
-                else:
-                    self._safe_print("❌ Failed to save configuration")
-                    return 1
-                    
-            elif action == 'sample':
-                sample_path = config.create_sample_config()
-                if sample_path:
-                    self._safe_print(f"✅ Sample configuration created: {sample_path}")
-                else:
-                    self._safe_print("❌ Failed to create sample configuration")
-                    return 1
-            
+            if action is None:
+                action = next((a for a in self.CONFIG_ACTIONS
+                               if getattr(args, a, False)), 'show')
+
+            return getattr(self, self.CONFIG_ACTIONS[action])(config)
+
         except Exception as e:
-            self._safe_print(f"❌ Error: {e}")
+            _print_error(e)
             return 1
-        
-        return 0
     
     def run_read(self, args):
         """Execute unified read command with smart auto-detection"""
-        import time
-        from pathlib import Path
         
         # Validate input
         if not os.path.exists(args.input):
             self._safe_print(f"❌ Error: Input not found: {args.input}")
             return 1
         
-        verbose = getattr(args, 'verbose', False)
-        quiet = getattr(args, 'quiet', False)
-        
+        # Resolve every read option once; the rest of the method and the
+        # scan/rebuild converters read plain attributes
+        ropts = _ReadOptions.from_namespace(args)
+        verbose = ropts.verbose
+        quiet = ropts.quiet
+
         # Override detection if user specified
-        if getattr(args, 'as_images', False):
+        if ropts.as_images:
             detection_result = "qr_images_dir" if os.path.isdir(args.input) else "qr_image_file"
             stats = None
-        elif getattr(args, 'as_chunks', False):
+        elif ropts.as_chunks:
             detection_result = "chunk_files_dir" if os.path.isdir(args.input) else "chunk_file"
             stats = None
         else:
-            # Smart auto-detection
-            detection = self.detect_input_type(args.input)
+            # Smart auto-detection - quiet runs never show the per-category
+            # counts, so let detection short-circuit on large mixed dirs
+            detection = self.detect_input_type(args.input, fast=quiet)
             if isinstance(detection, tuple):
                 detection_result, stats = detection
             else:
@@ -1113,7 +1557,7 @@ Examples:
                     self._safe_print(f"✨ Detected: Mixed content directory")
         
         # Route to appropriate processing based on detection and mode
-        mode = getattr(args, 'mode', 'auto')
+        mode = ropts.mode
         
         try:
             if detection_result in ["qr_image_file", "qr_images_dir"]:
@@ -1123,11 +1567,11 @@ Examples:
                     return 1
                 
                 if not quiet:
-                    auto_rebuild_note = " with auto-rebuild" if getattr(args, 'auto_rebuild', True) else ""
+                    auto_rebuild_note = " with auto-rebuild" if ropts.auto_rebuild else ""
                     self._safe_print(f"📸 Processing QR images{auto_rebuild_note}...")
-                
+
                 # Convert args for scan command
-                scan_args = self._convert_read_args_to_scan(args)
+                scan_args = self._convert_read_args_to_scan(args.input, ropts)
                 return self.run_scan(scan_args)
                 
             elif detection_result in ["chunk_file", "chunk_files_dir"]:
@@ -1140,7 +1584,7 @@ Examples:
                     self._safe_print(f"🔧 Rebuilding files from chunks...")
                 
                 # Convert args for rebuild command
-                rebuild_args = self._convert_read_args_to_rebuild(args)
+                rebuild_args = self._convert_read_args_to_rebuild(args.input, ropts)
                 return self.run_rebuild(rebuild_args)
                 
             elif detection_result == "mixed_content":
@@ -1149,9 +1593,10 @@ Examples:
                     self._safe_print(f"🎯 Processing mixed content...")
                 
                 if mode == 'scan-only':
-                    # Only scan the images
-                    if stats and len(stats['qr_images']) > 0:
-                        scan_args = self._convert_read_args_to_scan(args)
+                    # Only scan the images (stats=None means a fast mixed
+                    # detection, which already implies both kinds exist)
+                    if stats is None or len(stats['qr_images']) > 0:
+                        scan_args = self._convert_read_args_to_scan(args.input, ropts)
                         scan_args.auto_rebuild = False  # Force no rebuild
                         return self.run_scan(scan_args)
                     else:
@@ -1160,8 +1605,8 @@ Examples:
                         
                 elif mode == 'rebuild-only':
                     # Only rebuild from chunks
-                    if stats and len(stats['chunk_files']) > 0:
-                        rebuild_args = self._convert_read_args_to_rebuild(args)
+                    if stats is None or len(stats['chunk_files']) > 0:
+                        rebuild_args = self._convert_read_args_to_rebuild(args.input, ropts)
                         return self.run_rebuild(rebuild_args)
                     else:
                         self._safe_print("❌ No chunk files found for rebuild-only mode")
@@ -1171,18 +1616,18 @@ Examples:
                     # Process both: scan images first, then rebuild everything
                     success_count = 0
                     
-                    if stats and len(stats['qr_images']) > 0:
-                        if verbose:
+                    if stats is None or len(stats['qr_images']) > 0:
+                        if verbose and stats:
                             self._safe_print(f"📸 Step 1: Scanning {len(stats['qr_images'])} QR images...")
-                        scan_args = self._convert_read_args_to_scan(args)
+                        scan_args = self._convert_read_args_to_scan(args.input, ropts)
                         scan_result = self.run_scan(scan_args)
                         if scan_result == 0:
                             success_count += 1
-                    
-                    if stats and len(stats['chunk_files']) > 0:
-                        if verbose:
+
+                    if stats is None or len(stats['chunk_files']) > 0:
+                        if verbose and stats:
                             self._safe_print(f"🔧 Step 2: Rebuilding from {len(stats['chunk_files'])} chunk files...")
-                        rebuild_args = self._convert_read_args_to_rebuild(args)
+                        rebuild_args = self._convert_read_args_to_rebuild(args.input, ropts)
                         rebuild_result = self.run_rebuild(rebuild_args)
                         if rebuild_result == 0:
                             success_count += 1
@@ -1211,122 +1656,137 @@ Examples:
                 return 1
                 
         except Exception as e:
-            self._safe_print(f"❌ Error during processing: {e}")
+            _print_error(f"during processing: {e}")
             if verbose:
-                import traceback
-                traceback.print_exc()
+                _print_traceback()
             return 1
     
-    def _convert_read_args_to_scan(self, args):
-        """Convert read command args to scan command args"""
-        scan_args = argparse.Namespace()
-        
-        # Map arguments
-        scan_args.input = args.input  # Fixed: now uses 'input' instead of 'input_dir'
-        scan_args.output = getattr(args, 'output', None) or "./scan_output"
-        scan_args.auto_reconstruct = getattr(args, 'auto_rebuild', True)
-        scan_args.verbose = getattr(args, 'verbose', False)
-        scan_args.quiet = getattr(args, 'quiet', False)
-        scan_args.verify_checksums = getattr(args, 'verify_checksums', True)
-        scan_args.pattern = getattr(args, 'pattern', None)
-        scan_args.recursive = getattr(args, 'recursive', False)
-        scan_args.organized = getattr(args, 'organized', True)
-        scan_args.auto_cleanup = getattr(args, 'auto_cleanup', True)
-        scan_args.scan_summary = getattr(args, 'read_summary', True)
-        scan_args.max_errors = getattr(args, 'max_errors', 10)
-        
-        return scan_args
-    
-    def _convert_read_args_to_rebuild(self, args):
-        """Convert read command args to rebuild command args"""
-        rebuild_args = argparse.Namespace()
-        
-        # Map arguments  
-        rebuild_args.input = args.input  # This maps to the new 'input' argument
-        rebuild_args.output_dir = getattr(args, 'output', None)
-        rebuild_args.verify = getattr(args, 'verify_checksums', False)
-        rebuild_args.encrypted = getattr(args, 'encrypted', False)
-        rebuild_args.spaces = getattr(args, 'spaces', False)
-        rebuild_args.verbose = getattr(args, 'verbose', False)
-        rebuild_args.quiet = getattr(args, 'quiet', False)
-        rebuild_args.pattern = getattr(args, 'pattern', None)
-        rebuild_args.recursive = getattr(args, 'recursive', False)
-        rebuild_args.organized = getattr(args, 'organized', True)
-        rebuild_args.auto_cleanup = getattr(args, 'auto_cleanup', True)
-        rebuild_args.rebuild_summary = getattr(args, 'read_summary', True)
-        rebuild_args.batch = False  # Single operation
-        rebuild_args.suffix = None
-        
-        return rebuild_args
+    def _convert_read_args_to_scan(self, input_path, ropts):
+        """Convert resolved read options to scan command args"""
+        return argparse.Namespace(
+            input=input_path,
+            output=ropts.output or "./scan_output",
+            auto_reconstruct=ropts.auto_rebuild,
+            verbose=ropts.verbose,
+            quiet=ropts.quiet,
+            verify_checksums=ropts.verify_checksums,
+            pattern=ropts.pattern,
+            recursive=ropts.recursive,
+            organized=ropts.organized,
+            auto_cleanup=ropts.auto_cleanup,
+            scan_summary=ropts.read_summary,
+            max_errors=ropts.max_errors,
+        )
+
+    def _convert_read_args_to_rebuild(self, input_path, ropts):
+        """Convert resolved read options to rebuild command args"""
+        return argparse.Namespace(
+            input=input_path,
+            output_dir=ropts.output,
+            verify=ropts.verify_checksums,
+            encrypted=ropts.encrypted,
+            spaces=ropts.spaces,
+            verbose=ropts.verbose,
+            quiet=ropts.quiet,
+            pattern=ropts.pattern,
+            recursive=ropts.recursive,
+            organized=ropts.organized,
+            auto_cleanup=ropts.auto_cleanup,
+            rebuild_summary=ropts.read_summary,
+            batch=False,  # Single operation
+            suffix=None,
+        )
     
-    def detect_input_type(self, input_path):
-        """Smart detection of input content type for unified read command"""
-        from pathlib import Path
-        import glob
-        
-        if not os.path.exists(input_path):
+    def detect_input_type(self, input_path, fast=False):
+        """Smart detection of input content type for unified read command
+
+        With fast=True the directory scan only tracks whether each category
+        exists and stops as soon as both QR images and chunk files have been
+        seen - enough to pick a processing route without enumerating a large
+        mixed directory. Fast directory results carry stats=None; callers
+        that display per-category counts should use the default full scan.
+        """
+
+        # One stat answers exists/isfile/isdir (and feeds the chunk sniff
+        # cache key) instead of three syscalls on the same path
+        try:
+            st = os.stat(input_path)
+        except OSError:
             return "not_found"
-        
-        if os.path.isfile(input_path):
+
+        if stat.S_ISREG(st.st_mode):
             # Single file - check extension
             ext = Path(input_path).suffix.lower()
-            if ext in {'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.tif'}:
+            if ext in _IMAGE_EXTS:
                 return "qr_image_file"
-            elif ext == '.txt':
-                # Check if it's a QR chunk file by reading first few lines
-                try:
-                    with open(input_path, 'r', encoding='utf-8') as f:
-                        content = f.read(200)  # Read first 200 chars
-                        if '--BEGIN part_' in content and 'file:' in content:
-                            return "chunk_file"
-                except:
-                    pass
+            elif ext in _CHUNK_EXTS:
+                # Check if it's a QR chunk file by sniffing its head bytes
+                if _sniff_chunk_file(input_path, st.st_mtime_ns, st.st_size):
+                    return "chunk_file"
                 return "text_file"
             else:
                 return "unknown_file"
-        
-        if os.path.isdir(input_path):
-            # Directory - analyze contents
-            stats = {
+
+        if stat.S_ISDIR(st.st_mode):
+            # Directory - analyze contents (stats lists only kept on a full
+            # scan; fast mode just flags category presence)
+            stats = None if fast else {
                 'qr_images': [],
                 'chunk_files': [],
                 'other_files': [],
                 'total_files': 0
             }
-            
-            # Scan directory for relevant files
-            for file_path in Path(input_path).iterdir():
-                if file_path.is_file():
-                    stats['total_files'] += 1
-                    ext = file_path.suffix.lower()
-                    
-                    if ext in {'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.tif'}:
-                        stats['qr_images'].append(str(file_path))
-                    elif ext == '.txt':
-                        # Check if it's a chunk file
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read(200)
-                                if '--BEGIN part_' in content and 'file:' in content:
-                                    stats['chunk_files'].append(str(file_path))
-                                else:
-                                    stats['other_files'].append(str(file_path))
-                        except:
-                            stats['other_files'].append(str(file_path))
-                    else:
-                        stats['other_files'].append(str(file_path))
-            
+            has_qr_images = False
+            has_chunk_files = False
+            total_files = 0
+
+            # Scan directory for relevant files - os.scandir classifies each
+            # entry from the DirEntry's cached type and name, so no extra
+            # stat per file the way Path.iterdir()/is_file()/suffix cost
+            with os.scandir(input_path) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        total_files += 1
+                        ext = os.path.splitext(entry.name)[1].lower()
+
+                        if ext in _IMAGE_EXTS:
+                            has_qr_images = True
+                            if stats is not None:
+                                stats['qr_images'].append(entry.path)
+                        elif ext in _CHUNK_EXTS:
+                            # Check if it's a chunk file (scandir already has
+                            # the stat result cached on the entry)
+                            try:
+                                st = entry.stat(follow_symlinks=False)
+                                is_chunk = _sniff_chunk_file(
+                                    entry.path, st.st_mtime_ns, st.st_size)
+                            except OSError:
+                                is_chunk = False
+                            if is_chunk:
+                                has_chunk_files = True
+                                if stats is not None:
+                                    stats['chunk_files'].append(entry.path)
+                            elif stats is not None:
+                                stats['other_files'].append(entry.path)
+                        elif stats is not None:
+                            stats['other_files'].append(entry.path)
+
+                        # The route is decided once both kinds exist - in
+                        # fast mode stop enumerating right there
+                        if fast and has_qr_images and has_chunk_files:
+                            return "mixed_content", None
+
+            if stats is not None:
+                stats['total_files'] = total_files
+
             # Determine directory type based on contents
-            has_qr_images = len(stats['qr_images']) > 0
-            has_chunk_files = len(stats['chunk_files']) > 0
-            
             if has_qr_images and has_chunk_files:
                 return "mixed_content", stats
             elif has_qr_images:
                 return "qr_images_dir", stats
             elif has_chunk_files:
                 return "chunk_files_dir", stats
-            elif stats['total_files'] == 0:
+            elif total_files == 0:
                 return "empty_dir", stats
             else:
                 return "unknown_dir", stats
@@ -1335,7 +1795,18 @@ Examples:
     
     def run(self, argv=None):
         """Main entry point"""
-        parser = self.create_parser()
+        if argv is None:
+            argv = sys.argv[1:]
+
+        # 'qr --version' is a pure print - scripted pipelines probe it, so
+        # answer before paying for any argparse construction
+        if len(argv) == 1 and argv[0] in ('--version', '-V'):
+            print(f'qr {self.version}')
+            return 0
+
+        # Peek at the requested command so create_parser can skip building
+        # the subparser trees that can't be reached this invocation
+        parser = self.create_parser(argv[0] if argv else None)
         args = parser.parse_args(argv)
         
         # Handle no command provided
@@ -1344,20 +1815,12 @@ Examples:
             return 1
         
         # Route to appropriate command handler
-        if args.command in ['generate', 'gen', 'g']:
-            return self.run_generate(args)
-        elif args.command in ['scan', 's']:
-            return self.run_scan(args)
-        elif args.command in ['rebuild', 'r']:
-            return self.run_rebuild(args)
-        elif args.command in ['config', 'cfg']:
-            return self.run_config(args)
-        elif args.command in ['read', 'r']:
-            return self.run_read(args)
-        else:
+        handler_name = self.COMMAND_HANDLERS.get(args.command)
+        if handler_name is None:
             self._safe_print(f"❌ Error: Unknown command: {args.command}")
             parser.print_help()
             return 1
+        return getattr(self, handler_name)(args)
 
 def main():
     """Main entry point for the unified CLI"""
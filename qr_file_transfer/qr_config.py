@@ -4,49 +4,158 @@ QR Configuration Management
 Handle user preferences and configuration files
 """
 
+import functools
 import os
 import json
 import sys
 from pathlib import Path
 from typing import Dict, Any, Optional
 
-# Default configuration
-DEFAULT_CONFIG = {
+# orjson's C parser/serializer is several times faster than the stdlib on
+# both directions; fall back to json so the dependency stays optional
+try:
+    import orjson
+
+    def _loads_json(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps_json_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dumps_json_compact(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _loads_json(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps_json_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def _dumps_json_compact(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+# Default configuration, kept as a JSON bytes literal: the C parser builds
+# the tree faster than import-time dict-literal bytecode, and the same bytes
+# double as a template for cheap fresh copies (max_chunk_size is a
+# conservative estimate of QR capacity)
+_DEFAULT_CONFIG_BYTES = b"""{
     "qr_settings": {
         "box_size": 10,
         "border": 4,
         "error_correction": "L",
-        "max_chunk_size": 2362  # Conservative estimate
+        "max_chunk_size": 2362
     },
     "sheet_settings": {
-        "enabled": True,
+        "enabled": true,
         "size": 9,
         "columns": 3,
         "padding": 20
     },
     "output_settings": {
         "display": "none",
-        "cleanup": False,
-        "force": False,
-        "verbose": False,
-        "quiet": False
+        "cleanup": false,
+        "force": false,
+        "verbose": false,
+        "quiet": false
     },
     "scanning_settings": {
-        "verify_checksums": True,
-        "auto_reconstruct": False,
+        "verify_checksums": true,
+        "auto_reconstruct": false,
         "output_dir": "./scanned_chunks"
     },
     "security_settings": {
-        "enable_checksums": True,
+        "enable_checksums": true,
         "hash_algorithm": "sha256"
     }
-}
+}"""
+
+DEFAULT_CONFIG = _loads_json(_DEFAULT_CONFIG_BYTES)
+
+# Shared empty-dict sentinel for missing-section lookups - never mutated,
+# saves building a throwaway {} per miss
+_EMPTY: Dict[str, Any] = {}
+
+# Raw config-file bytes keyed by (path, mtime_ns, size); extra QRConfig
+# instances in one process skip the disk read while the file is unchanged
+_READ_CACHE: Dict[tuple, bytes] = {}
+
+# CLI option ↔ config key mapping driving update_from_args/apply_to_args:
+# (args attribute, section, key, kind, filled by apply_to_args).
+# 'value' options count as explicitly provided when not None; 'flag'
+# options only when switched on.
+_ARG_MAP = (
+    ('box_size', 'qr_settings', 'box_size', 'value', True),
+    ('border', 'qr_settings', 'border', 'value', True),
+    ('sheet', 'sheet_settings', 'enabled', 'flag', True),
+    ('sheet_size', 'sheet_settings', 'size', 'value', True),
+    ('sheet_cols', 'sheet_settings', 'columns', 'value', True),
+    ('display', 'output_settings', 'display', 'value', True),
+    ('cleanup', 'output_settings', 'cleanup', 'flag', True),
+    ('force', 'output_settings', 'force', 'flag', True),
+    ('verbose', 'output_settings', 'verbose', 'flag', True),
+    ('quiet', 'output_settings', 'quiet', 'flag', True),
+    ('auto_reconstruct', 'scanning_settings', 'auto_reconstruct', 'flag', False),
+)
+
+# Intern the table strings so the update/apply loops and their getattr/dict
+# probes hit CPython's pointer-equality fast path instead of re-hashing the
+# same section and key names on every row
+_ARG_MAP = tuple(
+    (sys.intern(attr), sys.intern(section), sys.intern(key), kind, applies)
+    for attr, section, key, kind, applies in _ARG_MAP
+)
+
+@functools.lru_cache(maxsize=1)
+def _default_config_path() -> str:
+    """Resolve the platform config file path once per process
+
+    Resolution is read-only (no makedirs) - save_config creates the
+    directory when a file is actually written.
+    """
+    if sys.platform.startswith('win'):
+        # Windows: Use AppData
+        config_dir = os.path.expanduser("~\\AppData\\Local\\QR-Transfer")
+    elif sys.platform.startswith('darwin'):
+        # macOS: Use ~/Library/Application Support
+        config_dir = os.path.expanduser("~/Library/Application Support/QR-Transfer")
+    else:
+        # Linux: Use XDG config directory
+        config_dir = os.path.expanduser("~/.config/qr-transfer")
+
+    return os.path.join(config_dir, "config.json")
 
 class QRConfig:
     def __init__(self, config_path: Optional[str] = None):
-        self.config_path = config_path or self._get_default_config_path()
-        self.config = DEFAULT_CONFIG.copy()
-        self.load_config()
+        # Path resolution and the file read+parse are both deferred until
+        # something actually asks for a value - callers that never touch
+        # the config pay nothing
+        self._config_path_arg = config_path
+        self._config_path: Optional[str] = None
+        self._config: Optional[Dict[str, Any]] = None
+        # Tracks in-memory changes since load; save_config no-ops when clean
+        self._dirty = False
+
+    @property
+    def config_path(self) -> str:
+        if self._config_path is None:
+            self._config_path = self._config_path_arg or self._get_default_config_path()
+        return self._config_path
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        if self._config is None:
+            # Fresh nested tree per instance - a shallow .copy() would share
+            # the section dicts with DEFAULT_CONFIG and let set() mutate the
+            # module defaults; the JSON roundtrip builds the tree in one C
+            # pass, faster than copy.deepcopy
+            self._config = _loads_json(_DEFAULT_CONFIG_BYTES)
+            self.load_config()
+        return self._config
+
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        self._config = value
+        self._dirty = True
     
     def _safe_print(self, text):
         """Print text with fallback for Unicode issues on Windows"""
@@ -59,67 +168,90 @@ class QRConfig:
     
     def _get_default_config_path(self) -> str:
         """Get the default configuration file path"""
-        if sys.platform.startswith('win'):
-            # Windows: Use AppData
-            config_dir = os.path.expanduser("~\\AppData\\Local\\QR-Transfer")
-        elif sys.platform.startswith('darwin'):
-            # macOS: Use ~/Library/Application Support
-            config_dir = os.path.expanduser("~/Library/Application Support/QR-Transfer")
-        else:
-            # Linux: Use XDG config directory
-            config_dir = os.path.expanduser("~/.config/qr-transfer")
-        
-        os.makedirs(config_dir, exist_ok=True)
-        return os.path.join(config_dir, "config.json")
+        return _default_config_path()
     
     def load_config(self) -> bool:
-        """Load configuration from file"""
-        if not os.path.exists(self.config_path):
+        """Load the saved configuration file over the current tree"""
+        try:
+            st = os.stat(self.config_path)
+        except OSError:
             return False
-        
+
+        # '{}' is the smallest valid config; empty or truncated-to-nothing
+        # files aren't worth opening (the stat is already paid above)
+        if st.st_size < 2:
+            return False
+
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                saved_config = json.load(f)
-            
+            # Reuse bytes read by an earlier instance while the file is
+            # unchanged; each load still parses them so the merged tree
+            # never aliases cached state. Binary read - the parser handles
+            # UTF-8 itself (orjson raises a JSONDecodeError subclass of
+            # ValueError, same as stdlib)
+            cache_key = (self.config_path, st.st_mtime_ns, st.st_size)
+            data = _READ_CACHE.get(cache_key)
+            if data is None:
+                with open(self.config_path, 'rb') as f:
+                    data = f.read()
+                _READ_CACHE[cache_key] = data
+            saved_config = _loads_json(data)
+
             # Merge saved config with defaults (preserves new defaults for missing keys)
             self._merge_config(self.config, saved_config)
+            self._dirty = False
             return True
-            
-        except (json.JSONDecodeError, IOError) as e:
+
+        except (ValueError, IOError) as e:
             print(f"Warning: Could not load config from {self.config_path}: {e}")
             return False
     
     def save_config(self) -> bool:
-        """Save current configuration to file"""
+        """Save current configuration to file (skipped when unchanged)"""
+        if not self._dirty:
+            return True
+
         try:
             os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-            
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2)
-            
+
+            # Compact form - the config file is machine-owned (humans edit
+            # the indented sample), and half the bytes means half the read
+            # and parse work on every start
+            with open(self.config_path, 'wb') as f:
+                f.write(_dumps_json_compact(self.config))
+
+            self._dirty = False
             return True
-            
+
         except IOError as e:
             print(f"Error: Could not save config to {self.config_path}: {e}")
             return False
     
     def _merge_config(self, base: Dict[str, Any], update: Dict[str, Any]) -> None:
-        """Recursively merge configuration dictionaries"""
-        for key, value in update.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._merge_config(base[key], value)
-            else:
-                base[key] = value
+        """Merge configuration dictionaries, nested sections included
+
+        Walks an explicit work stack instead of recursing - no per-level
+        frame setup or method re-dispatch on this per-invocation path.
+        """
+        stack = [(base, update)]
+        while stack:
+            b, u = stack.pop()
+            for key, value in u.items():
+                bv = b.get(key)
+                if isinstance(bv, dict) and isinstance(value, dict):
+                    stack.append((bv, value))
+                else:
+                    b[key] = value
     
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """Get a configuration value"""
-        return self.config.get(section, {}).get(key, default)
+        return self.config.get(section, _EMPTY).get(key, default)
     
     def set(self, section: str, key: str, value: Any) -> None:
         """Set a configuration value"""
         if section not in self.config:
             self.config[section] = {}
         self.config[section][key] = value
+        self._dirty = True
     
     def get_section(self, section: str) -> Dict[str, Any]:
         """Get an entire configuration section"""
@@ -128,113 +260,71 @@ class QRConfig:
     def set_section(self, section: str, values: Dict[str, Any]) -> None:
         """Set an entire configuration section"""
         self.config[section] = values
+        self._dirty = True
     
     def update_from_args(self, args) -> None:
         """Update configuration from command line arguments"""
-        # QR settings - only update if explicitly provided and not None
-        if hasattr(args, 'box_size') and args.box_size is not None:
-            self.set('qr_settings', 'box_size', args.box_size)
-        
-        if hasattr(args, 'border') and args.border is not None:
-            self.set('qr_settings', 'border', args.border)
-        
-        # Sheet settings
-        if hasattr(args, 'sheet') and args.sheet:
-            self.set('sheet_settings', 'enabled', args.sheet)
-        
-        if hasattr(args, 'sheet_size') and args.sheet_size is not None:
-            self.set('sheet_settings', 'size', args.sheet_size)
-        
-        if hasattr(args, 'sheet_cols') and args.sheet_cols is not None:
-            self.set('sheet_settings', 'columns', args.sheet_cols)
-        
-        # Output settings
-        if hasattr(args, 'display') and args.display is not None:
-            self.set('output_settings', 'display', args.display)
-        
-        if hasattr(args, 'cleanup') and args.cleanup:
-            self.set('output_settings', 'cleanup', args.cleanup)
-        
-        if hasattr(args, 'force') and args.force:
-            self.set('output_settings', 'force', args.force)
-        
-        if hasattr(args, 'verbose') and args.verbose:
-            self.set('output_settings', 'verbose', args.verbose)
-        
-        if hasattr(args, 'quiet') and args.quiet:
-            self.set('output_settings', 'quiet', args.quiet)
-        
-        # Scanning settings
-        if hasattr(args, 'output') and args.output is not None and args.output != DEFAULT_CONFIG['scanning_settings']['output_dir']:
-            self.set('scanning_settings', 'output_dir', args.output)
-        
-        if hasattr(args, 'auto_reconstruct') and args.auto_reconstruct:
-            self.set('scanning_settings', 'auto_reconstruct', args.auto_reconstruct)
-    
+        # Only update keys explicitly provided on the command line, per the
+        # kind rules encoded in _ARG_MAP
+        # One vars() call exposes the Namespace dict; per-row membership is
+        # then a single hash instead of a getattr miss per absent option
+        config = self.config
+        provided = vars(args)
+        for attr, section, key, kind, _ in _ARG_MAP:
+            value = provided.get(attr)
+            if value is not None if kind == 'value' else value:
+                config.setdefault(section, {})[key] = value
+                self._dirty = True
+
+        # Scanning output dir: only a non-default path counts as explicit
+        output = provided.get('output')
+        if output is not None and output != DEFAULT_CONFIG['scanning_settings']['output_dir']:
+            config.setdefault('scanning_settings', {})['output_dir'] = output
+            self._dirty = True
+
     def apply_to_args(self, args) -> None:
         """Apply configuration to command line arguments (fill in defaults)"""
-        # Only apply if not explicitly set by user and ensure we don't set None values
-        if getattr(args, 'box_size', None) is None:
-            config_value = self.get('qr_settings', 'box_size', DEFAULT_CONFIG['qr_settings']['box_size'])
-            args.box_size = config_value if config_value is not None else DEFAULT_CONFIG['qr_settings']['box_size']
-        
-        if getattr(args, 'border', None) is None:
-            config_value = self.get('qr_settings', 'border', DEFAULT_CONFIG['qr_settings']['border'])
-            args.border = config_value if config_value is not None else DEFAULT_CONFIG['qr_settings']['border']
-        
-        if not getattr(args, 'sheet', False):
-            config_value = self.get('sheet_settings', 'enabled', DEFAULT_CONFIG['sheet_settings']['enabled'])
-            args.sheet = config_value if config_value is not None else DEFAULT_CONFIG['sheet_settings']['enabled']
-        
-        if getattr(args, 'sheet_size', None) is None:
-            config_value = self.get('sheet_settings', 'size', DEFAULT_CONFIG['sheet_settings']['size'])
-            args.sheet_size = config_value if config_value is not None else DEFAULT_CONFIG['sheet_settings']['size']
-        
-        if getattr(args, 'sheet_cols', None) is None:
-            config_value = self.get('sheet_settings', 'columns', DEFAULT_CONFIG['sheet_settings']['columns'])
-            args.sheet_cols = config_value if config_value is not None else DEFAULT_CONFIG['sheet_settings']['columns']
-        
-        if getattr(args, 'display', None) is None:
-            config_value = self.get('output_settings', 'display', DEFAULT_CONFIG['output_settings']['display'])
-            args.display = config_value if config_value is not None else DEFAULT_CONFIG['output_settings']['display']
-        
-        if not getattr(args, 'cleanup', False):
-            config_value = self.get('output_settings', 'cleanup', DEFAULT_CONFIG['output_settings']['cleanup'])
-            args.cleanup = config_value if config_value is not None else DEFAULT_CONFIG['output_settings']['cleanup']
-        
-        if not getattr(args, 'force', False):
-            config_value = self.get('output_settings', 'force', DEFAULT_CONFIG['output_settings']['force'])
-            args.force = config_value if config_value is not None else DEFAULT_CONFIG['output_settings']['force']
-        
-        if not getattr(args, 'verbose', False):
-            config_value = self.get('output_settings', 'verbose', DEFAULT_CONFIG['output_settings']['verbose'])
-            args.verbose = config_value if config_value is not None else DEFAULT_CONFIG['output_settings']['verbose']
-        
-        if not getattr(args, 'quiet', False):
-            config_value = self.get('output_settings', 'quiet', DEFAULT_CONFIG['output_settings']['quiet'])
-            args.quiet = config_value if config_value is not None else DEFAULT_CONFIG['output_settings']['quiet']
+        # Only apply if not explicitly set by user and ensure we don't set
+        # None values - one section/key lookup per option, with the builtin
+        # default covering both a missing key and an explicit null. Local
+        # bindings keep the loop on LOAD_FAST instead of repeated global
+        # lookups
+        config = self.config
+        defaults = DEFAULT_CONFIG
+        for attr, section, key, kind, applies in _ARG_MAP:
+            if not applies:
+                continue
+            current = getattr(args, attr, None)
+            if current is None if kind == 'value' else not current:
+                config_value = config.get(section, _EMPTY).get(key)
+                setattr(args, attr,
+                        config_value if config_value is not None
+                        else defaults[section][key])
     
     def print_config(self) -> None:
         """Print current configuration"""
-        self._safe_print("📋 Current Configuration:")
-        self._safe_print(f"  Config file: {self.config_path}")
-        self._safe_print("")
-        
+        # Assemble the whole listing and emit it as one write instead of a
+        # print (and its stdout lock round-trip) per line
+        lines = [
+            "📋 Current Configuration:",
+            f"  Config file: {self.config_path}",
+            "",
+        ]
         for section, values in self.config.items():
-            self._safe_print(f"[{section}]")
-            for key, value in values.items():
-                self._safe_print(f"  {key} = {value}")
-            self._safe_print("")
+            lines.append(f"[{section}]")
+            lines.extend(f"  {key} = {value}" for key, value in values.items())
+            lines.append("")
+        self._safe_print("\n".join(lines))
     
     def reset_to_defaults(self) -> None:
         """Reset configuration to defaults"""
-        self.config = DEFAULT_CONFIG.copy()
+        self.config = _loads_json(_DEFAULT_CONFIG_BYTES)
     
     def create_sample_config(self, path: Optional[str] = None) -> str:
         """Create a sample configuration file"""
         sample_path = path or "qr-config-sample.json"
         
-        sample_config = DEFAULT_CONFIG.copy()
+        sample_config = _loads_json(_DEFAULT_CONFIG_BYTES)
         sample_config["_comment"] = {
             "description": "QR File Transfer Tool Configuration",
             "generated": "This is a sample configuration file",
@@ -242,38 +332,54 @@ class QRConfig:
         }
         
         try:
-            with open(sample_path, 'w', encoding='utf-8') as f:
-                json.dump(sample_config, f, indent=2)
-            
+            with open(sample_path, 'wb') as f:
+                f.write(_dumps_json_bytes(sample_config))
+
             return sample_path
-            
+
         except IOError as e:
             print(f"Error creating sample config: {e}")
             return ""
 
 def main():
     """Configuration tool main function"""
-    import argparse
-    
-    parser = argparse.ArgumentParser(description="QR Transfer Configuration Tool")
-    parser.add_argument('--show', action='store_true', help='Show current configuration')
-    parser.add_argument('--reset', action='store_true', help='Reset to default configuration')
-    parser.add_argument('--sample', action='store_true', help='Create sample configuration file')
-    parser.add_argument('--config', help='Specify configuration file path')
-    
-    args = parser.parse_args()
-    
-    config = QRConfig(args.config)
-    
-    if args.show:
+    argv = sys.argv[1:]
+
+    # Four plain flags don't justify importing and building argparse on
+    # every invocation; scan argv directly and only construct the real
+    # parser when usage output is actually requested
+    if '-h' in argv or '--help' in argv:
+        import argparse
+
+        parser = argparse.ArgumentParser(description="QR Transfer Configuration Tool")
+        parser.add_argument('--show', action='store_true', help='Show current configuration')
+        parser.add_argument('--reset', action='store_true', help='Reset to default configuration')
+        parser.add_argument('--sample', action='store_true', help='Create sample configuration file')
+        parser.add_argument('--config', help='Specify configuration file path')
+        parser.parse_args(argv)
+        return
+
+    config_path = None
+    for i, arg in enumerate(argv):
+        if arg == '--config':
+            if i + 1 >= len(argv):
+                print("Error: --config requires a path", file=sys.stderr)
+                sys.exit(2)
+            config_path = argv[i + 1]
+        elif arg.startswith('--config='):
+            config_path = arg[len('--config='):]
+
+    config = QRConfig(config_path)
+
+    if '--show' in argv:
         config.print_config()
-    elif args.reset:
+    elif '--reset' in argv:
         config.reset_to_defaults()
         if config.save_config():
             config._safe_print("✅ Configuration reset to defaults")
         else:
             config._safe_print("❌ Failed to save configuration")
-    elif args.sample:
+    elif '--sample' in argv:
         sample_path = config.create_sample_config()
         if sample_path:
             config._safe_print(f"✅ Sample configuration created: {sample_path}")
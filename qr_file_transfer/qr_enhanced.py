@@ -14,8 +14,10 @@ import shutil
 import hashlib
 import getpass
 import base64
+import mmap
 import secrets
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
 from qr_config import QRConfig
@@ -23,13 +25,21 @@ from qr_config import QRConfig
 # Encryption support
 try:
     from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
     from cryptography.hazmat.backends import default_backend
     HAS_CRYPTO = True
 except ImportError:
     HAS_CRYPTO = False
 
+# Optional faster QR encoder - segno's encoder is much quicker than the
+# pure-Python qrcode library and produces equivalent matrices; fall back
+# to qrcode when it isn't installed
+try:
+    import segno
+    HAS_SEGNO = True
+except ImportError:
+    HAS_SEGNO = False
+
 # Try to import tqdm for progress bars, fall back gracefully
 try:
     from tqdm import tqdm as tqdm_lib
@@ -85,78 +95,237 @@ MAX_CHUNK_SIZE = int(MAX_QR_BYTES * SAFETY_MARGIN)
 
 class QRCrypto:
     """Handles AES-256 encryption/decryption for QR data"""
-    
+
     def __init__(self):
         self.backend = default_backend()
-    
+        self._session_salt = None
+        self._key_cache = {}  # (password, salt) -> derived key
+        self._aes_cache = {}  # key bytes -> algorithms.AES instance
+        self._gcm_cache = {}  # key bytes -> AESGCM instance
+
+    def _gcm(self, key: bytes):
+        """Reuse one AESGCM object per key, like _aes_algorithm for CBC"""
+        gcm = self._gcm_cache.get(key)
+        if gcm is None:
+            gcm = self._gcm_cache[key] = AESGCM(key)
+        return gcm
+
+    def _aes_algorithm(self, key: bytes):
+        """Reuse one algorithms.AES object per key
+
+        All chunks of a session share the key, so the key-length validation
+        and object construction happen once instead of per chunk. A full
+        EVP context can't be reused across messages through cryptography's
+        public API (each Cipher is single-use), so the per-chunk cost left
+        is just the Cipher wrapper around the cached algorithm.
+        """
+        algo = self._aes_cache.get(key)
+        if algo is None:
+            algo = self._aes_cache[key] = algorithms.AES(key)
+        return algo
+
     def derive_key(self, password: str, salt: bytes) -> bytes:
-        """Derive encryption key from password using PBKDF2"""
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,  # 256 bits
-            salt=salt,
-            iterations=100000,  # Strong iteration count
-            backend=self.backend
-        )
-        return kdf.derive(password.encode('utf-8'))
-    
-    def encrypt_data(self, data: str, password: str) -> tuple[bytes, bytes, bytes]:
-        """Encrypt data with AES-256-CBC, returns (encrypted_data, salt, iv)"""
-        # Generate random salt and IV
-        salt = secrets.token_bytes(16)  # 128-bit salt
-        iv = secrets.token_bytes(16)    # 128-bit IV
-        
-        # Derive key from password
-        key = self.derive_key(password, salt)
-        
-        # PKCS7 padding
-        data_bytes = data.encode('utf-8')
-        padding_length = 16 - (len(data_bytes) % 16)
-        padded_data = data_bytes + bytes([padding_length] * padding_length)
-        
-        # Encrypt
-        cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=self.backend)
-        encryptor = cipher.encryptor()
-        encrypted_data = encryptor.update(padded_data) + encryptor.finalize()
-        
+        """Derive encryption key from password using PBKDF2 (cached per password+salt)"""
+        cache_key = (password, salt)
+        key = self._key_cache.get(cache_key)
+        if key is None:
+            # hashlib.pbkdf2_hmac goes straight to OpenSSL's native PBKDF2,
+            # which is considerably faster than layering the derivation
+            # through the cryptography KDF object (same output either way)
+            key = hashlib.pbkdf2_hmac(
+                'sha256',
+                password.encode('utf-8'),
+                salt,
+                100000,  # Strong iteration count
+                dklen=32  # 256 bits
+            )
+            self._key_cache[cache_key] = key
+        return key
+
+    def session_key(self, password: str) -> tuple[bytes, bytes]:
+        """Return (key, salt) for this crypto session
+
+        Reuses one random salt per crypto session so the expensive PBKDF2
+        derivation runs once per password instead of once per chunk.
+        """
+        if self._session_salt is None:
+            self._session_salt = secrets.token_bytes(16)  # 128-bit salt
+        salt = self._session_salt
+        return self.derive_key(password, salt), salt
+
+    def encrypt_with_key(self, data, key: bytes, salt: bytes) -> tuple[bytes, bytes, bytes]:
+        """Encrypt data with an already-derived key, returns (encrypted_data, salt, iv)
+
+        AES-256-GCM: iv is a fresh 96-bit nonce per chunk and the 16-byte
+        auth tag rides appended to the ciphertext. Unlike the old CBC
+        mode there is no padding and no per-block chaining, so AES-NI can
+        pipeline blocks and the tag authenticates the chunk. data may be
+        str or already-encoded UTF-8 bytes.
+        """
+        iv = secrets.token_bytes(12)    # 96-bit GCM nonce
+        data_bytes = data if isinstance(data, bytes) else data.encode('utf-8')
+        encrypted_data = self._gcm(key).encrypt(iv, data_bytes, None)
         return encrypted_data, salt, iv
+
+    def encrypt_data(self, data: str, password: str) -> tuple[bytes, bytes, bytes]:
+        """Encrypt data with AES-256-GCM, returns (encrypted_data, salt, nonce)"""
+        key, salt = self.session_key(password)
+        return self.encrypt_with_key(data, key, salt)
     
     def decrypt_data(self, encrypted_data: bytes, salt: bytes, iv: bytes, password: str) -> str:
-        """Decrypt AES-256-CBC encrypted data"""
+        """Decrypt an encrypted chunk (GCM nonce, or legacy CBC 16-byte IV)"""
         # Derive key from password
         key = self.derive_key(password, salt)
-        
-        # Decrypt
-        cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=self.backend)
+
+        if len(iv) == 12:
+            # Current format: GCM, tag appended to the ciphertext
+            return self._gcm(key).decrypt(iv, encrypted_data, None).decode('utf-8')
+
+        # Legacy CBC chunks from before the GCM switch
+        cipher = Cipher(self._aes_algorithm(key), modes.CBC(iv), backend=self.backend)
         decryptor = cipher.decryptor()
         padded_data = decryptor.update(encrypted_data) + decryptor.finalize()
-        
+
         # Remove PKCS7 padding
         padding_length = padded_data[-1]
         data_bytes = padded_data[:-padding_length]
-        
+
         return data_bytes.decode('utf-8')
-    
+
     def encode_encrypted_chunk(self, encrypted_data: bytes, salt: bytes, iv: bytes) -> str:
         """Encode encrypted chunk as base64 for QR storage"""
-        # Format: SALT(16) + IV(16) + ENCRYPTED_DATA
+        # Format: SALT(16) + NONCE(12) + CIPHERTEXT+TAG
         combined = salt + iv + encrypted_data
         return base64.b64encode(combined).decode('ascii')
-    
+
     def decode_encrypted_chunk(self, encoded_data: str) -> tuple[bytes, bytes, bytes]:
         """Decode base64 encrypted chunk, returns (encrypted_data, salt, iv)"""
         combined = base64.b64decode(encoded_data.encode('ascii'))
         salt = combined[:16]
-        iv = combined[16:32]
-        encrypted_data = combined[32:]
+        iv = combined[16:28]
+        encrypted_data = combined[28:]
         return encrypted_data, salt, iv
 
+def get_encryption_password() -> str:
+    """Securely prompt for encryption password"""
+    if not HAS_CRYPTO:
+        raise RuntimeError("Cryptography library not available. Install with: pip install cryptography")
+
+    print("🔐 Encryption enabled - password required")
+    while True:
+        password = getpass.getpass("Enter encryption password: ")
+        if len(password) < 8:
+            print("❌ Password must be at least 8 characters long")
+            continue
+
+        confirm = getpass.getpass("Confirm password: ")
+        if password != confirm:
+            print("❌ Passwords do not match")
+            continue
+
+        return password
+
+# Per-process state for the QR worker pool. QR encoding, AES, and PIL all
+# run substantial Python bytecode under the GIL, so threads serialize; a
+# process pool scales with cores. The initializer stores the shared bits
+# once so each task only ships (i, chunk, chunk_hash, chunk_size) over
+# the pipe.
+_worker_state = None
+
+def _utf8_len(s):
+    """UTF-8 byte length of s, skipping the encode for pure-ASCII text
+
+    str.isascii() is a flag check on CPython's compact strings, so ASCII
+    content (the common case for the source/log files this tool targets)
+    pays no per-line encode at all.
+    """
+    return len(s) if s.isascii() else len(s.encode('utf-8'))
+
+def _segno_png_bytes(data, version, box_size, border):
+    """Render one QR code to PNG bytes with segno (level L, no micro QR)"""
+    buffer = BytesIO()
+    # Low zlib level: QR pixels compress trivially, so level 1 is several
+    # times faster than the default for a negligible size difference
+    segno.make(data, error='l', version=version, boost_error=False, micro=False).save(
+        buffer, kind='png', scale=box_size, border=border, compresslevel=1)
+    return buffer.getvalue()
+
+def _init_qr_worker(filename, total_parts, file_hash, key, salt, box_size, border, qr_version):
+    global _worker_state
+    _worker_state = {
+        'filename': filename,
+        'total_parts': total_parts,
+        'file_hash': file_hash,
+        'key': key,
+        'salt': salt,
+        'crypto': QRCrypto() if (key is not None and HAS_CRYPTO) else None,
+        # One encoder per worker: clear() between chunks keeps the RS/BCH
+        # tables and, with the pre-fitted version pinned, make(fit=False)
+        # skips the per-chunk auto-fit search
+        'qr': qrcode.QRCode(
+            version=qr_version,
+            error_correction=qrcode.ERROR_CORRECT_L,
+            box_size=box_size,
+            border=border,
+        ),
+        'qr_version': qr_version,
+        # The segno path renders without the prebuilt encoder and needs
+        # the sizing directly
+        'box_size': box_size,
+        'border': border,
+    }
+
+def _generate_qr_chunk_task(task):
+    """Generate one QR chunk in a pool worker, returns (i, png_bytes, chunk_hash, chunk_bytes)
+
+    Returns encoded PNG bytes rather than a PIL Image so the result
+    pickles cheaply; the parent reopens it with Image.open.
+    """
+    i, chunk, chunk_hash, chunk_size = task
+    chunk_hash = chunk_hash.hex()  # raw 8-byte digest travels, hex is built here
+    state = _worker_state
+    total_parts = state['total_parts']
+    filename = state['filename']
+    file_hash = state['file_hash']
+
+    if state['crypto'] is not None:
+        encrypted_data, salt, iv = state['crypto'].encrypt_with_key(
+            chunk.encode('utf-8'), state['key'], state['salt'])
+        header = f"--BEGIN ENCRYPTED part_{i:02}_of_{total_parts:02} file: {filename} chunk_hash: {chunk_hash} file_hash: {file_hash}--\n"
+        footer = f"--END ENCRYPTED part_{i:02}--"
+        # Keep the payload as bytes: the base64 output feeds the QR
+        # encoder directly instead of roundtripping through an ASCII str
+        payload = header.encode('utf-8') + base64.b64encode(salt + iv + encrypted_data) + footer.encode('utf-8')
+    else:
+        header = f"--BEGIN part_{i:02}_of_{total_parts:02} file: {filename} chunk_hash: {chunk_hash} file_hash: {file_hash}--\n"
+        footer = f"--END part_{i:02}--"
+        payload = header + chunk + footer
+
+    if HAS_SEGNO:
+        png_bytes = _segno_png_bytes(payload, state['qr_version'], state['box_size'], state['border'])
+        return (i, png_bytes, chunk_hash, chunk_size)
+
+    qr = state['qr']
+    qr.clear()
+    qr.add_data(payload)
+    qr.make(fit=state['qr_version'] is None)
+    qr_img = qr.make_image(fill_color="black", back_color="white")
+
+    buffer = BytesIO()
+    qr_img.save(buffer, format='PNG', optimize=False, compress_level=1)
+    return (i, buffer.getvalue(), chunk_hash, chunk_size)
+
 class QRTransferTool:
     def __init__(self, args):
         self.args = args
         self.temp_dir = None
         self.qr_files = []
         self.file_hash = None
+        self.chunk_hashes = None
+        self.chunk_sizes = None
+        self.qr_version = None
+        self._qr_encoder = None
+        self._font = None
         self.crypto = QRCrypto() if HAS_CRYPTO else None
         self.encryption_password = None
     
@@ -189,30 +358,40 @@ class QRTransferTool:
 
     def get_encryption_password(self) -> str:
         """Securely prompt for encryption password"""
-        if not HAS_CRYPTO:
-            raise RuntimeError("Cryptography library not available. Install with: pip install cryptography")
-        
-        self._safe_print("🔐 Encryption enabled - password required")
-        while True:
-            password = getpass.getpass("Enter encryption password: ")
-            if len(password) < 8:
-                self._safe_print("❌ Password must be at least 8 characters long")
-                continue
-            
-            confirm = getpass.getpass("Confirm password: ")
-            if password != confirm:
-                self._safe_print("❌ Passwords do not match")
-                continue
-                
-            return password
+        return get_encryption_password()
 
     def calculate_file_hash(self, content):
         """Calculate SHA-256 hash of entire file content"""
         return hashlib.sha256(content.encode('utf-8')).hexdigest()
 
     def calculate_chunk_hash(self, chunk_content):
-        """Calculate SHA-256 hash of chunk content"""
-        return hashlib.sha256(chunk_content.encode('utf-8')).hexdigest()[:16]  # First 16 chars for space
+        """Calculate the truncated SHA-256 digest of chunk content
+
+        Returns the raw first 8 bytes; .hex() of it equals the 16-char
+        prefix the rebuild tools verify against. Keeping bytes avoids
+        allocating a full 64-char hexdigest per chunk just to slice it.
+        """
+        return hashlib.sha256(chunk_content.encode('utf-8')).digest()[:8]
+
+    def compute_all_hashes(self, chunks):
+        """Hash every chunk and the whole file in a single pass
+
+        The chunks concatenate back to the original content, so each
+        chunk's UTF-8 bytes can feed both its own digest and a rolling
+        file-wide digest — every byte goes through SHA-256 once instead
+        of twice. Returns (file_hash, chunk_hashes, chunk_sizes): the hex
+        file hash, raw 8-byte chunk digests (hex-encoded at header
+        assembly), and sizes in UTF-8 bytes.
+        """
+        file_hasher = hashlib.sha256()
+        chunk_hashes = []
+        chunk_sizes = []
+        for chunk in chunks:
+            chunk_bytes = chunk.encode('utf-8')
+            chunk_hashes.append(hashlib.sha256(chunk_bytes).digest()[:8])
+            chunk_sizes.append(len(chunk_bytes))
+            file_hasher.update(chunk_bytes)
+        return file_hasher.hexdigest(), chunk_hashes, chunk_sizes
 
     def sanitize_file(self, filepath):
         """Read and sanitize file content, preserving formatting with memory optimization"""
@@ -224,86 +403,34 @@ class QRTransferTool:
                 print(f"🧠 Large file detected ({file_size:,} bytes), using memory-optimized streaming...")
             return self._stream_large_file(filepath, file_size)
         
-        # Show progress for large files
-        with tqdm(total=file_size, desc="📖 Reading file", unit="B", unit_scale=True, 
-                 disable=self.args.quiet or file_size < 1024*1024) as pbar:
-            
-            with open(filepath, "rb") as f:
-                chunks = []
-                while True:
-                    chunk = f.read(8192)  # Read in 8KB chunks
-                    if not chunk:
-                        break
-                    chunks.append(chunk)
-                    pbar.update(len(chunk))
-                
-                raw = b''.join(chunks)
-        
+        # One read() hands the whole file to the OS read path; no chunk
+        # list, no join, no per-8KB progress updates
+        with open(filepath, "rb") as f:
+            raw = f.read()
+
         # Strip UTF-8 BOM if present
         if raw.startswith(b'\xef\xbb\xbf'):
             raw = raw[3:]
         return raw.decode("utf-8", errors="replace")
 
     def _stream_large_file(self, filepath, file_size):
-        """Stream large files in chunks to optimize memory usage"""
-        buffer_size = 1024 * 1024  # 1MB buffer
-        decoded_parts = []
-        
-        with tqdm(total=file_size, desc="📖 Streaming large file", unit="B", unit_scale=True, 
-                 disable=self.args.quiet) as pbar:
-            
-            with open(filepath, "rb") as f:
-                # Handle UTF-8 BOM if present
-                first_chunk = f.read(3)
-                if first_chunk.startswith(b'\xef\xbb\xbf'):
-                    first_chunk = first_chunk[3:]
-                    pbar.update(3)
-                
-                # Process first chunk
-                if first_chunk:
-                    remaining_bytes = first_chunk
-                else:
-                    remaining_bytes = b''
-                
-                while True:
-                    chunk = f.read(buffer_size)
-                    if not chunk:
-                        # Process any remaining bytes
-                        if remaining_bytes:
-                            try:
-                                decoded_parts.append(remaining_bytes.decode("utf-8", errors="replace"))
-                            except UnicodeDecodeError:
-                                decoded_parts.append(remaining_bytes.decode("utf-8", errors="replace"))
-                        break
-                    
-                    pbar.update(len(chunk))
-                    
-                    # Combine with remaining bytes from previous iteration
-                    full_chunk = remaining_bytes + chunk
-                    
-                    # Find the last complete UTF-8 character boundary
-                    # to avoid splitting multi-byte characters
-                    decode_end = len(full_chunk)
-                    remaining_bytes = b''
-                    
-                    # Look for incomplete UTF-8 sequences at the end
-                    for i in range(min(4, len(full_chunk))):
-                        try:
-                            test_chunk = full_chunk[:decode_end-i]
-                            decoded = test_chunk.decode("utf-8")
-                            # If successful, save any remaining bytes
-                            if i > 0:
-                                remaining_bytes = full_chunk[decode_end-i:]
-                            decoded_parts.append(decoded)
-                            break
-                        except UnicodeDecodeError:
-                            continue
-                    else:
-                        # If we can't decode, use error handling
-                        decoded_parts.append(full_chunk.decode("utf-8", errors="replace"))
-                        remaining_bytes = b''
-        
-        return ''.join(decoded_parts)
+        """Decode a large file via mmap without double-buffering it
+
+        The old 1MB-loop decoded piecewise and joined at the end, which
+        held the raw bytes and the decoded parts at once. Mapping the
+        file and decoding straight from the buffer does one pass in C
+        and never splits a multi-byte character.
+        """
+        with open(filepath, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    # Strip UTF-8 BOM if present
+                    if view[:3] == b'\xef\xbb\xbf':
+                        view = view[3:]
+                    return str(view, "utf-8", "replace")
+                finally:
+                    view.release()
 
     def split_at_line_boundaries(self, data, max_chunk_size):
         """Split data into chunks at line boundaries with memory optimization"""
@@ -315,36 +442,54 @@ class QRTransferTool:
         
         lines = data.splitlines(keepends=True)
         chunks = []
-        current = ''
-        
-        # Progress bar for chunking large files
-        with tqdm(lines, desc="🔄 Analyzing content", disable=self.args.quiet or len(lines) < 1000) as pbar:
-            for line in pbar:
-                line_bytes = len(line.encode("utf-8"))
-                current_bytes = len(current.encode("utf-8"))
-                
-                if current_bytes + line_bytes > max_chunk_size and current:
-                    chunks.append(current)
-                    current = ''
-                current += line
-                
+        current = []  # list of lines, joined only when a chunk is flushed
+        current_bytes = 0  # running UTF-8 size of current, no re-encoding
+
+        # Progress bar for chunking large files, updated in batches so the
+        # per-line cost stays a couple of C calls
+        with tqdm(total=len(lines), desc="🔄 Analyzing content",
+                 disable=self.args.quiet or len(lines) < 1000) as pbar:
+            for processed, line in enumerate(lines, 1):
+                line_bytes = _utf8_len(line)
+
+                if current and current_bytes + line_bytes > max_chunk_size:
+                    chunks.append(''.join(current))
+                    current = []
+                    current_bytes = 0
+                current.append(line)
+                current_bytes += line_bytes
+
+                if processed % 4096 == 0:
+                    pbar.update(4096)
+
         if current:
-            chunks.append(current)
+            chunks.append(''.join(current))
         return chunks
 
     def _stream_chunk_large_content(self, data, max_chunk_size):
         """Stream-based chunking for very large content to minimize memory usage"""
+        # NumPy rides along with opencv for the scanning side; when it is
+        # available the boundary search runs vectorized instead of one
+        # find('\n') per line
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if np is not None:
+            return self._chunk_large_content_numpy(np, data, max_chunk_size)
+
         chunks = []
-        current = ''
+        current = []  # list of lines, joined only when a chunk is flushed
+        current_bytes = 0  # running UTF-8 size of current, no re-encoding
         line_start = 0
-        
+
         # Estimate total lines for progress bar
         estimated_lines = data.count('\n') + 1
         processed_lines = 0
-        
-        with tqdm(total=estimated_lines, desc="🔄 Streaming chunk analysis", 
+
+        with tqdm(total=estimated_lines, desc="🔄 Streaming chunk analysis",
                  disable=self.args.quiet, unit="lines") as pbar:
-            
+
             while line_start < len(data):
                 # Find next line ending
                 line_end = data.find('\n', line_start)
@@ -356,71 +501,124 @@ class QRTransferTool:
                     # Include the newline character
                     line = data[line_start:line_end + 1]
                     line_start = line_end + 1
-                
-                line_bytes = len(line.encode("utf-8"))
-                current_bytes = len(current.encode("utf-8"))
-                
-                if current_bytes + line_bytes > max_chunk_size and current:
-                    chunks.append(current)
-                    current = ''
-                
-                current += line
+
+                line_bytes = _utf8_len(line)
+
+                if current and current_bytes + line_bytes > max_chunk_size:
+                    chunks.append(''.join(current))
+                    current = []
+                    current_bytes = 0
+
+                current.append(line)
+                current_bytes += line_bytes
                 processed_lines += 1
-                
+
                 # Update progress every 1000 lines
                 if processed_lines % 1000 == 0:
                     pbar.update(1000)
-        
+
         if current:
-            chunks.append(current)
-        
+            chunks.append(''.join(current))
+
         return chunks
 
-    def generate_qr_image(self, data, error_correction=qrcode.ERROR_CORRECT_L):
-        """Generate a single QR code image"""
+    def _chunk_large_content_numpy(self, np, data, max_chunk_size):
+        """Vectorized line-boundary chunking via cumulative byte sums
+
+        One split('\n') replaces millions of per-line find() calls, and
+        chunk boundaries come from searchsorted over the cumulative line
+        sizes - each boundary is one binary search instead of a Python
+        loop over every line. Produces the same greedy chunking as the
+        scalar path.
+        """
+        lines = data.split('\n')
+        # A trailing newline yields an empty final element; drop it so it
+        # can't surface as an empty chunk and let the real last line keep
+        # its '\n' instead
+        trailing_newline = lines[-1] == ''
+        if trailing_newline:
+            lines.pop()
+        n = len(lines)
+        if n == 0:
+            return [data] if data else []
+
+        size_of = len if data.isascii() else _utf8_len
+        lens = np.fromiter(map(size_of, lines), dtype=np.int64, count=n)
+        lens += 1  # reinstate the '\n' stripped by split
+        if not trailing_newline:
+            lens[-1] -= 1  # the final line never had one
+
+        cum = np.cumsum(lens)
+        chunks = []
+        start = 0
+        start_total = 0
+        while start < n:
+            end = int(np.searchsorted(cum, start_total + max_chunk_size, side='right'))
+            if end <= start:
+                end = start + 1  # single line larger than max_chunk_size
+            text = '\n'.join(lines[start:end])
+            if end < n or trailing_newline:
+                text += '\n'
+            chunks.append(text)
+            start_total = int(cum[end - 1])
+            start = end
+        return chunks
+
+    def _determine_qr_version(self, chunks, filename, total_parts):
+        """Fit the largest chunk payload once and return its QR version
+
+        Auto-fit re-runs the capacity search for every chunk even though
+        all payloads of a file share the same header size. One best_fit
+        on the largest payload gives a version every chunk fits in, so
+        per-chunk generation can run with fit disabled.
+        """
+        largest = max(range(total_parts), key=self.chunk_sizes.__getitem__)
+        if self.args.encrypt and self.encryption_password and self.crypto:
+            # Encrypted bodies expand deterministically: 16-byte salt,
+            # 12-byte nonce, ciphertext the size of the plaintext plus a
+            # 16-byte GCM tag, then base64 — size the stand-in body the
+            # same way without paying for a real encryption
+            combined_len = 44 + self.chunk_sizes[largest]
+            body = 'a' * (4 * ((combined_len + 2) // 3))
+            header = f"--BEGIN ENCRYPTED part_{total_parts:02}_of_{total_parts:02} file: {filename} chunk_hash: {self.chunk_hashes[largest].hex()} file_hash: {self.file_hash}--\n"
+            footer = f"--END ENCRYPTED part_{total_parts:02}--"
+        else:
+            body = chunks[largest]
+            header = f"--BEGIN part_{total_parts:02}_of_{total_parts:02} file: {filename} chunk_hash: {self.chunk_hashes[largest].hex()} file_hash: {self.file_hash}--\n"
+            footer = f"--END part_{total_parts:02}--"
+
         qr = qrcode.QRCode(
-            version=None,  # Auto-determine version
-            error_correction=error_correction,
+            error_correction=qrcode.ERROR_CORRECT_L,
             box_size=self.args.box_size,
             border=self.args.border,
         )
+        # optimize=0 keeps the probe as one byte-mode segment, an upper
+        # bound on however the real encoder segments each payload
+        qr.add_data(header + body + footer, optimize=0)
+        return qr.best_fit()
+
+    def generate_qr_image(self, data, error_correction=qrcode.ERROR_CORRECT_L):
+        """Generate a single QR code image (reuses one encoder instance)"""
+        # segno only handles the level-L path this tool actually uses;
+        # anything else falls through to qrcode
+        if HAS_SEGNO and error_correction == qrcode.ERROR_CORRECT_L:
+            png_bytes = _segno_png_bytes(data, self.qr_version, self.args.box_size, self.args.border)
+            return Image.open(BytesIO(png_bytes))
+
+        qr = self._qr_encoder
+        if qr is None or qr.error_correction != error_correction:
+            qr = self._qr_encoder = qrcode.QRCode(
+                version=self.qr_version,
+                error_correction=error_correction,
+                box_size=self.args.box_size,
+                border=self.args.border,
+            )
+        qr.clear()
+        qr.version = self.qr_version
         qr.add_data(data)
-        qr.make(fit=True)
+        qr.make(fit=self.qr_version is None)
         return qr.make_image(fill_color="black", back_color="white")
 
-    def generate_single_qr_chunk(self, chunk_data):
-        """Generate a single QR code chunk (for parallel processing)"""
-        i, chunk, filename, total_parts = chunk_data
-        
-        # Handle encryption if enabled
-        if self.args.encrypt and self.encryption_password and self.crypto:
-            if self.args.verbose:
-                self._safe_print(f"  🔐 Encrypting chunk {i:02d}...")
-            
-            # Encrypt the chunk content
-            encrypted_data, salt, iv = self.crypto.encrypt_data(chunk, self.encryption_password)
-            encoded_chunk = self.crypto.encode_encrypted_chunk(encrypted_data, salt, iv)
-            
-            # Calculate hash of original content for integrity
-            chunk_hash = self.calculate_chunk_hash(chunk)
-            
-            # Create encrypted payload with metadata
-            header = f"--BEGIN ENCRYPTED part_{i:02}_of_{total_parts:02} file: {filename} chunk_hash: {chunk_hash} file_hash: {self.file_hash}--\n"
-            footer = f"--END ENCRYPTED part_{i:02}--"
-            payload = header + encoded_chunk + footer
-            
-        else:
-            # Standard unencrypted processing
-            chunk_hash = self.calculate_chunk_hash(chunk)
-            header = f"--BEGIN part_{i:02}_of_{total_parts:02} file: {filename} chunk_hash: {chunk_hash} file_hash: {self.file_hash}--\n"
-            footer = f"--END part_{i:02}--"
-            payload = header + chunk + footer
-        
-        # Generate QR image
-        qr_img = self.generate_qr_image(payload)
-        
-        return (i, qr_img, chunk_hash, len(chunk.encode('utf-8')))
-
     def create_qr_sheet(self, qr_images, cols=3):
         """Combine multiple QR codes into a single sheet"""
         if not qr_images:
@@ -435,15 +633,19 @@ class QRTransferTool:
         sheet_width = cols * qr_size + (cols + 1) * padding
         sheet_height = rows * qr_size + (rows + 1) * padding + 60  # Extra for labels
         
-        # Create sheet image with progress tracking
-        sheet = Image.new('RGB', (sheet_width, sheet_height), 'white')
+        # Bilevel sheet: QR output is monochrome anyway and mode '1' keeps
+        # the buffer 24x smaller than RGB
+        sheet = Image.new('1', (sheet_width, sheet_height), 1)
         draw = ImageDraw.Draw(sheet)
         
-        # Try to load a font
-        try:
-            font = ImageFont.truetype("arial.ttf", 12)
-        except:
-            font = ImageFont.load_default()
+        font = self._get_font()
+
+        # All labels share the digit-width template, so one measurement
+        # covers the sheet instead of a shaping call per QR
+        sample_label = f"Part {len(qr_images):02d}"
+        if self.args.encrypt:
+            sample_label += " 🔐"
+        label_width = draw.textlength(sample_label, font=font)
         
         # Place QR codes with labels
         with tqdm(qr_images, desc="📋 Creating sheet", disable=self.args.quiet) as pbar:
@@ -454,9 +656,8 @@ class QRTransferTool:
                 x = padding + col * (qr_size + padding)
                 y = padding + row * (qr_size + padding + 30)
                 
-                # Paste QR code (convert to RGB if needed)
-                if qr_img.mode != 'RGB':
-                    qr_img = qr_img.convert('RGB')
+                # paste() converts to the sheet mode itself, so no per-QR
+                # full-buffer convert() is needed
                 sheet.paste(qr_img, (x, y))
                 
                 # Add label with encryption indicator
@@ -464,14 +665,21 @@ class QRTransferTool:
                 if self.args.encrypt:
                     label += " 🔐"
                     
-                text_bbox = draw.textbbox((0, 0), label, font=font)
-                text_width = text_bbox[2] - text_bbox[0]
-                label_x = x + (qr_size - text_width) // 2
+                label_x = x + int(qr_size - label_width) // 2
                 label_y = y + qr_size + 5
                 draw.text((label_x, label_y), label, fill='black', font=font)
         
         return sheet
 
+    def _get_font(self):
+        """Load the sheet label font once; face parsing is slow"""
+        if self._font is None:
+            try:
+                self._font = ImageFont.truetype("arial.ttf", 12)
+            except Exception:
+                self._font = ImageFont.load_default()
+        return self._font
+
     def process_file(self, filepath):
         """Main processing function"""
         if not os.path.exists(filepath):
@@ -480,30 +688,28 @@ class QRTransferTool:
         if self.args.verbose:
             print(f"📁 Processing file: {filepath}")
             
-        # Handle encryption password if needed
-        if self.args.encrypt:
+        # Handle encryption password if needed (a batch driver may have
+        # injected a shared password/crypto already)
+        if self.args.encrypt and not self.encryption_password:
             self.encryption_password = self.get_encryption_password()
             if self.args.verbose:
                 self._safe_print("🔐 Encryption enabled - content will be secured")
             
         # Read and prepare content
         content = self.sanitize_file(filepath)
-        content_bytes = len(content.encode('utf-8'))
-        
-        # Calculate file hash for integrity verification
-        if not self.args.quiet:
-            self._safe_print("🔒 Calculating file hash...")
-        self.file_hash = self.calculate_file_hash(content)
         
-        if self.args.verbose:
-            self._safe_print(f"📊 File size: {content_bytes:,} bytes")
-            self._safe_print(f"🔒 File hash: {self.file_hash[:16]}...")
-            
         # Split into chunks
         chunks = self.split_at_line_boundaries(content, MAX_CHUNK_SIZE)
         total_parts = len(chunks)
-        
+
+        # Hash chunks and the whole file in one pass for integrity verification
+        if not self.args.quiet:
+            self._safe_print("🔒 Calculating file hash...")
+        self.file_hash, self.chunk_hashes, self.chunk_sizes = self.compute_all_hashes(chunks)
+
         if self.args.verbose:
+            self._safe_print(f"📊 File size: {sum(self.chunk_sizes):,} bytes")
+            self._safe_print(f"🔒 File hash: {self.file_hash[:16]}...")
             print(f"🔄 Split into {total_parts} chunk(s)")
             
         if total_parts > 100 and not self.args.force:
@@ -519,52 +725,51 @@ class QRTransferTool:
         encryption_status = " with AES-256 encryption" if self.args.encrypt else " with integrity verification"
         if not self.args.quiet:
             self._safe_print(f"🎯 Generating {total_parts} QR codes{encryption_status}...")
+
+        # Pin the QR version once so per-chunk generation skips the
+        # auto-fit search; empty files have no payload to probe
+        if total_parts:
+            self.qr_version = self._determine_qr_version(chunks, filename, total_parts)
             
         # Use parallel processing for better performance (if more than 3 chunks)
         if total_parts > 3 and not self.args.no_parallel:
+            max_workers = min(os.cpu_count() or 2, total_parts)
             if self.args.verbose:
-                max_workers = min(8, (os.cpu_count() or 2) + 2)  # Reasonable default
-                print(f"🚀 Using parallel processing with {max_workers} workers...")
-            
-            # Prepare chunk data for parallel processing
-            chunk_data_list = [
-                (i+1, chunk, filename, total_parts) 
+                print(f"🚀 Using parallel processing with {max_workers} worker processes...")
+
+            # Derive the session key up front so workers never see the password
+            key = salt = None
+            if self.args.encrypt and self.encryption_password and self.crypto:
+                key, salt = self.crypto.session_key(self.encryption_password)
+
+            # Each task carries only what differs per chunk; the shared
+            # metadata rides along once via the pool initializer
+            tasks = [
+                (i + 1, chunk, self.chunk_hashes[i], self.chunk_sizes[i])
                 for i, chunk in enumerate(chunks)
             ]
-            
-            # Results storage
-            results = {}
-            
-            # Use ThreadPoolExecutor for parallel QR generation
-            max_workers = min(8, (os.cpu_count() or 2) + 2)
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all tasks
-                future_to_index = {
-                    executor.submit(self.generate_single_qr_chunk, chunk_data): chunk_data[0] 
-                    for chunk_data in chunk_data_list
-                }
-                
-                # Process completed tasks with progress bar
-                progress_iter = as_completed(future_to_index)
+
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_qr_worker,
+                initargs=(filename, total_parts, self.file_hash, key, salt,
+                          self.args.box_size, self.args.border, self.qr_version),
+            ) as executor:
+                # Batch tasks per IPC round-trip; map preserves chunk order
+                chunksize = max(1, total_parts // (4 * max_workers))
+                result_iter = executor.map(_generate_qr_chunk_task, tasks, chunksize=chunksize)
                 if not self.args.quiet:
-                    progress_iter = tqdm(progress_iter, total=total_parts, desc="🎯 Generating QR codes", unit="QR")
-                
-                for future in progress_iter:
-                    index = future_to_index[future]
-                    try:
-                        i, qr_img, chunk_hash, chunk_bytes = future.result()
-                        results[i] = (qr_img, chunk_hash, chunk_bytes)
-                        
-                        if self.args.verbose:
-                            encryption_note = " (encrypted)" if self.args.encrypt else ""
-                            print(f"  📄 Part {i:02d}: {chunk_bytes:,} bytes, hash: {chunk_hash}{encryption_note}")
-                            
-                    except Exception as exc:
-                        self._safe_print(f"  ❌ Part {index} generated an exception: {exc}")
-                        
-            # Sort results by part number
-            qr_images = [results[i][0] for i in sorted(results.keys())]
-            
+                    result_iter = tqdm(result_iter, total=total_parts, desc="🎯 Generating QR codes", unit="QR")
+
+                for i, png_bytes, chunk_hash, chunk_bytes in result_iter:
+                    # Keep the encoded PNG; save_qr_codes writes it as-is
+                    # and only reopens it when composing sheets
+                    qr_images.append(png_bytes)
+
+                    if self.args.verbose:
+                        encryption_note = " (encrypted)" if self.args.encrypt else ""
+                        print(f"  📄 Part {i:02d}: {chunk_bytes:,} bytes, hash: {chunk_hash}{encryption_note}")
+
         else:
             # Sequential processing for small files
             chunk_iter = enumerate(chunks, 1)
@@ -579,19 +784,19 @@ class QRTransferTool:
                     
                     # Encrypt the chunk content
                     encrypted_data, salt, iv = self.crypto.encrypt_data(chunk, self.encryption_password)
-                    encoded_chunk = self.crypto.encode_encrypted_chunk(encrypted_data, salt, iv)
-                    
-                    # Calculate hash of original content for integrity
-                    chunk_hash = self.calculate_chunk_hash(chunk)
-                    
-                    # Create encrypted payload with metadata
+
+                    # Hash of original content, computed up front by compute_all_hashes
+                    chunk_hash = self.chunk_hashes[i - 1].hex()
+
+                    # Create encrypted payload with metadata, kept as bytes
+                    # so base64 output feeds the QR encoder directly
                     header = f"--BEGIN ENCRYPTED part_{i:02}_of_{total_parts:02} file: {filename} chunk_hash: {chunk_hash} file_hash: {self.file_hash}--\n"
                     footer = f"--END ENCRYPTED part_{i:02}--"
-                    payload = header + encoded_chunk + footer
-                    
+                    payload = header.encode('utf-8') + base64.b64encode(salt + iv + encrypted_data) + footer.encode('utf-8')
+
                 else:
                     # Standard unencrypted processing
-                    chunk_hash = self.calculate_chunk_hash(chunk)
+                    chunk_hash = self.chunk_hashes[i - 1].hex()
                     header = f"--BEGIN part_{i:02}_of_{total_parts:02} file: {filename} chunk_hash: {chunk_hash} file_hash: {self.file_hash}--\n"
                     footer = f"--END part_{i:02}--"
                     payload = header + chunk + footer
@@ -601,7 +806,7 @@ class QRTransferTool:
                 qr_images.append(qr_img)
                 
                 if self.args.verbose:
-                    chunk_bytes = len(chunk.encode('utf-8'))
+                    chunk_bytes = self.chunk_sizes[i - 1]
                     encryption_note = " (encrypted)" if self.args.encrypt else ""
                     print(f"  📄 Part {i:02d}: {chunk_bytes:,} bytes, hash: {chunk_hash}{encryption_note}")
                 
@@ -614,7 +819,12 @@ class QRTransferTool:
 
     def save_qr_codes(self, qr_images, filename, total_parts):
         """Save QR codes as individual files or sheets"""
-        output_dir = self.temp_dir if (self.args.cleanup and self.temp_dir) else "."
+        # Explicit output_dir from the caller wins over cwd - the batch CLI
+        # threads per-file target dirs through here instead of chdir'ing
+        if self.args.cleanup and self.temp_dir:
+            output_dir = self.temp_dir
+        else:
+            output_dir = getattr(self.args, 'output_dir', None) or "."
         base_name = Path(filename).stem
         
         # Add encryption suffix to filename
@@ -630,7 +840,9 @@ class QRTransferTool:
                 print(f"📋 Creating {(len(qr_images) + qrs_per_sheet - 1) // qrs_per_sheet} sheet(s)...")
             
             for i in range(0, len(qr_images), qrs_per_sheet):
-                sheet_qrs = qr_images[i:i + qrs_per_sheet]
+                # Workers hand back PNG bytes; sheets need pixel access
+                sheet_qrs = [Image.open(BytesIO(qr)) if isinstance(qr, bytes) else qr
+                             for qr in qr_images[i:i + qrs_per_sheet]]
                 sheet_img = self.create_qr_sheet(sheet_qrs, cols=self.args.sheet_cols)
                 if sheet_img:
                     sheets.append(sheet_img)
@@ -655,7 +867,13 @@ class QRTransferTool:
                 
             for i, qr_img in save_iter:
                 qr_file = os.path.join(output_dir, f"{base_name}_part_{i:02d}_of_{total_parts:02d}.png")
-                qr_img.save(qr_file)
+                if isinstance(qr_img, bytes):
+                    # Already-encoded PNG from a pool worker: write it
+                    # straight out instead of decoding and re-encoding
+                    with open(qr_file, 'wb') as f:
+                        f.write(qr_img)
+                else:
+                    qr_img.save(qr_file)
                 self.qr_files.append(qr_file)
                 
         # Display or open files
@@ -16,8 +16,7 @@ from pathlib import Path
 # Encryption support
 try:
     from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
     from cryptography.hazmat.backends import default_backend
     HAS_CRYPTO = True
 except ImportError:
@@ -30,20 +29,52 @@ class QRDecryption:
         if not HAS_CRYPTO:
             raise ImportError("Cryptography library required. Install with: pip install cryptography")
         self.backend = default_backend()
-    
+        self._key_cache = {}  # (password, salt) -> derived key
+
     def derive_key(self, password: str, salt: bytes) -> bytes:
-        """Derive decryption key from password using PBKDF2"""
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,  # 256 bits
-            salt=salt,
-            iterations=100000,  # Strong iteration count
-            backend=self.backend
-        )
-        return kdf.derive(password.encode('utf-8'))
-    
+        """Derive decryption key from password using PBKDF2 (cached per password+salt)"""
+        cache_key = (password, salt)
+        key = self._key_cache.get(cache_key)
+        if key is None:
+            # OpenSSL-native PBKDF2 via hashlib - same derivation as the
+            # cryptography KDF object, without the per-call object setup
+            key = hashlib.pbkdf2_hmac(
+                'sha256',
+                password.encode('utf-8'),
+                salt,
+                100000,  # Strong iteration count
+                dklen=32  # 256 bits
+            )
+            self._key_cache[cache_key] = key
+        return key
+
+    def decrypt_chunk(self, encoded_data: str, password: str) -> str:
+        """Decode and decrypt one base64 chunk
+
+        Current chunks are AES-256-GCM: SALT(16) + NONCE(12) +
+        CIPHERTEXT+TAG, where the tag authenticates the chunk. Chunks
+        written before the GCM switch (SALT(16) + IV(16) + CBC
+        ciphertext) fail the tag check and are retried as CBC.
+        """
+        try:
+            combined = base64.b64decode(encoded_data.encode('ascii'))
+        except Exception as e:
+            raise ValueError(f"Failed to decode encrypted chunk: {e}")
+        if len(combined) < 44:
+            raise ValueError("Invalid encrypted chunk format")
+
+        salt = combined[:16]
+        key = self.derive_key(password, salt)
+        try:
+            return AESGCM(key).decrypt(combined[16:28], combined[28:], None).decode('utf-8')
+        except Exception:
+            # Legacy CBC layout: 16-byte IV, block-aligned ciphertext
+            if len(combined) < 48 or (len(combined) - 32) % 16:
+                raise
+            return self.decrypt_data(combined[32:], salt, combined[16:32], password)
+
     def decrypt_data(self, encrypted_data: bytes, salt: bytes, iv: bytes, password: str) -> str:
-        """Decrypt AES-256-CBC encrypted data"""
+        """Decrypt legacy AES-256-CBC encrypted data"""
         # Derive key from password
         key = self.derive_key(password, salt)
         
@@ -62,11 +93,11 @@ class QRDecryption:
         """Decode base64 encrypted chunk, returns (encrypted_data, salt, iv)"""
         try:
             combined = base64.b64decode(encoded_data.encode('ascii'))
-            if len(combined) < 32:
+            if len(combined) < 44:
                 raise ValueError("Invalid encrypted chunk format")
             salt = combined[:16]
-            iv = combined[16:32]
-            encrypted_data = combined[32:]
+            iv = combined[16:28]
+            encrypted_data = combined[28:]
             return encrypted_data, salt, iv
         except Exception as e:
             raise ValueError(f"Failed to decode encrypted chunk: {e}")
@@ -125,8 +156,7 @@ def parse_chunk_file(file_path, password=None, decryption=None, verbose=False):
             
             # Decrypt the chunk content
             try:
-                encrypted_data, salt, iv = decryption.decode_encrypted_chunk(encrypted_data_b64)
-                chunk_content = decryption.decrypt_data(encrypted_data, salt, iv, password)
+                chunk_content = decryption.decrypt_chunk(encrypted_data_b64, password)
             except Exception as e:
                 raise ValueError(f"Failed to decrypt chunk {part_num}: {e}")
             
@@ -347,6 +377,16 @@ def reconstruct_file(chunk_dir="scanned_chunks", output_file=None, password=None
         print(f"❌ Error writing file: {e}")
         return False
 
+def rebuild(chunks_dir, output_file=None, password=None, verify_only=False, verbose=False):
+    """Rebuild files from encrypted chunks (direct entry point, no argv)"""
+    return reconstruct_file(
+        chunk_dir=chunks_dir,
+        output_file=output_file,
+        password=password,
+        verify_only=verify_only,
+        verbose=verbose
+    )
+
 def main():
     parser = argparse.ArgumentParser(
         description="QR Encrypted File Reconstruction Tool - Rebuild files from encrypted QR chunks",
@@ -380,8 +420,8 @@ Examples:
         sys.exit(1)
     
     try:
-        success = reconstruct_file(
-            chunk_dir=args.chunk_dir,
+        success = rebuild(
+            args.chunk_dir,
             output_file=args.output,
             password=args.password,
             verify_only=args.verify_only,
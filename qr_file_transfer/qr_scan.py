@@ -8,6 +8,7 @@ import os
 import sys
 import argparse
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from PIL import Image
 import cv2
@@ -15,6 +16,50 @@ import numpy as np
 from pyzbar import pyzbar
 import json
 
+def _scan_image_task(task):
+    """Scan one image for QR codes (module-level so it pickles into pool workers)
+
+    Returns (contents, qr_found, errors, messages); verbose messages ride
+    back with the result so the parent can print them in folder order.
+    """
+    image_path, verbose = task
+    contents = []
+    messages = []
+    errors = 0
+    try:
+        # Load straight to grayscale: pyzbar only reads luminance, so
+        # this skips the BGR->RGB conversion and keeps the pixel buffer
+        # a third of the size
+        gray = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+        if gray is None:
+            if verbose:
+                messages.append(f"  ❌ Could not load image: {image_path}")
+            return (contents, 0, 1, messages)
+
+        # Detect QR codes
+        qr_codes = pyzbar.decode(gray)
+
+        if verbose and qr_codes:
+            messages.append(f"  🔍 Found {len(qr_codes)} QR code(s) in {Path(image_path).name}")
+
+        found = 0
+        for qr in qr_codes:
+            try:
+                # Decode the QR content
+                contents.append(qr.data.decode('utf-8'))
+                found += 1
+            except UnicodeDecodeError:
+                if verbose:
+                    messages.append("    ⚠️  Unicode decode error in QR code")
+                errors += 1
+
+        return (contents, found, errors, messages)
+
+    except Exception as e:
+        if verbose:
+            messages.append(f"  ❌ Error processing {image_path}: {e}")
+        return (contents, 0, errors + 1, messages)
+
 class QRBatchScanner:
     def __init__(self, args):
         self.args = args
@@ -28,43 +73,12 @@ class QRBatchScanner:
 
     def scan_qr_codes_from_image(self, image_path):
         """Extract all QR codes from a single image"""
-        try:
-            # Load image with OpenCV
-            image = cv2.imread(str(image_path))
-            if image is None:
-                if self.args.verbose:
-                    print(f"  ❌ Could not load image: {image_path}")
-                self.stats['errors'] += 1
-                return []
-
-            # Convert to RGB for pyzbar
-            rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            
-            # Detect QR codes
-            qr_codes = pyzbar.decode(rgb_image)
-            
-            if self.args.verbose and qr_codes:
-                print(f"  🔍 Found {len(qr_codes)} QR code(s) in {Path(image_path).name}")
-            
-            results = []
-            for qr in qr_codes:
-                try:
-                    # Decode the QR content
-                    content = qr.data.decode('utf-8')
-                    results.append(content)
-                    self.stats['qr_codes_found'] += 1
-                except UnicodeDecodeError:
-                    if self.args.verbose:
-                        print(f"    ⚠️  Unicode decode error in QR code")
-                    self.stats['errors'] += 1
-                    
-            return results
-            
-        except Exception as e:
-            if self.args.verbose:
-                print(f"  ❌ Error processing {image_path}: {e}")
-            self.stats['errors'] += 1
-            return []
+        contents, found, errors, messages = _scan_image_task((image_path, self.args.verbose))
+        for message in messages:
+            print(message)
+        self.stats['qr_codes_found'] += found
+        self.stats['errors'] += errors
+        return contents
 
     def parse_chunk_metadata(self, content):
         """Parse QR chunk metadata with checksum support"""
@@ -116,25 +130,42 @@ class QRBatchScanner:
         if not self.args.quiet:
             print(f"📁 Found {len(image_files)} image file(s) to process")
             
-        # Process each image
-        for image_file in image_files:
-            if self.args.verbose:
-                print(f"📷 Processing: {image_file.name}")
-                
-            qr_contents = self.scan_qr_codes_from_image(image_file)
-            self.stats['images_processed'] += 1
-            
-            # Parse each QR code content
-            for content in qr_contents:
-                chunk_data = self.parse_chunk_metadata(content)
-                if chunk_data:
-                    self.found_chunks.append(chunk_data)
-                    self.stats['valid_chunks'] += 1
+        # Scan images; JPEG decode and the ZBar search are CPU-bound C
+        # work, so a process pool scales with cores on larger folders
+        if len(image_files) > 3:
+            tasks = [(image_file, self.args.verbose) for image_file in image_files]
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                scan_results = executor.map(_scan_image_task, tasks, chunksize=4)
+                for image_file, (qr_contents, found, errors, messages) in zip(image_files, scan_results):
                     if self.args.verbose:
-                        print(f"    ✅ Valid chunk: Part {chunk_data['part_num']:02d} of {chunk_data['total_parts']:02d}")
-                else:
-                    if self.args.verbose:
-                        print(f"    ⚠️  Invalid chunk format (not a file chunk QR)")
+                        print(f"📷 Processing: {image_file.name}")
+                    for message in messages:
+                        print(message)
+                    self.stats['qr_codes_found'] += found
+                    self.stats['errors'] += errors
+                    self.stats['images_processed'] += 1
+                    self._collect_chunks(qr_contents)
+        else:
+            for image_file in image_files:
+                if self.args.verbose:
+                    print(f"📷 Processing: {image_file.name}")
+
+                qr_contents = self.scan_qr_codes_from_image(image_file)
+                self.stats['images_processed'] += 1
+                self._collect_chunks(qr_contents)
+
+    def _collect_chunks(self, qr_contents):
+        """Parse scanned QR contents and record the valid chunks"""
+        for content in qr_contents:
+            chunk_data = self.parse_chunk_metadata(content)
+            if chunk_data:
+                self.found_chunks.append(chunk_data)
+                self.stats['valid_chunks'] += 1
+                if self.args.verbose:
+                    print(f"    ✅ Valid chunk: Part {chunk_data['part_num']:02d} of {chunk_data['total_parts']:02d}")
+            else:
+                if self.args.verbose:
+                    print(f"    ⚠️  Invalid chunk format (not a file chunk QR)")
 
     def validate_chunks(self):
         """Validate and organize found chunks"""
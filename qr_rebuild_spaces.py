@@ -35,31 +35,39 @@ def collect_chunks_from_folder(folder_path):
                     print(f"Warning: Skipped invalid chunk in {fname}")
     return chunks
 
-def main():
-    if len(sys.argv) != 2:
-        print("Usage: python qr_rebuild_spaces.py <folder_path>")
-        sys.exit(1)
-
-    folder = sys.argv[1]
-    if not os.path.isdir(folder):
-        print(f"Error: {folder} is not a valid folder.")
-        sys.exit(1)
-
-    print(f"Reading QR chunks from: {folder}")
-    chunks = collect_chunks_from_folder(folder)
+def rebuild(chunks_dir, output_dir=None):
+    """Rebuild a file from chunks_dir with tabs converted to spaces (direct entry point, no argv)"""
+    print(f"Reading QR chunks from: {chunks_dir}")
+    chunks = collect_chunks_from_folder(chunks_dir)
 
     if not chunks:
         print("No valid chunks found.")
-        return
+        return None
 
     chunks.sort(key=lambda x: x[0])
     output_filename = chunks[0][1] + "_spaces"
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+        output_filename = os.path.join(output_dir, output_filename)
     combined = "\n".join(chunk[2] for chunk in chunks)
 
     with open(output_filename, "w", encoding="utf-8") as out:
         out.write(combined)
 
     print(f"Successfully rebuilt file with tabs converted to spaces: {output_filename}")
+    return output_filename
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python qr_rebuild_spaces.py <folder_path>")
+        sys.exit(1)
+
+    folder = sys.argv[1]
+    if not os.path.isdir(folder):
+        print(f"Error: {folder} is not a valid folder.")
+        sys.exit(1)
+
+    rebuild(folder)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
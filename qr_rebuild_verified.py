@@ -131,28 +131,17 @@ def check_chunk_completeness(chunks):
     
     return results
 
-def main():
-    if len(sys.argv) not in [2, 3]:
-        print("Usage: python qr_rebuild_verified.py <folder_path> [--no-verify]")
-        print("  --no-verify: Skip checksum validation")
-        sys.exit(1)
-
-    folder = sys.argv[1]
-    verify_checksums = "--no-verify" not in sys.argv
-    
-    if not os.path.isdir(folder):
-        print(f"Error: {folder} is not a valid folder.")
-        sys.exit(1)
-
-    print(f"🔍 Reading QR chunks from: {folder}")
+def rebuild(chunks_dir, verify_checksums=True):
+    """Rebuild files from chunks_dir with integrity validation (direct entry point, no argv)"""
+    print(f"🔍 Reading QR chunks from: {chunks_dir}")
     print(f"🔒 Checksum verification: {'Enabled' if verify_checksums else 'Disabled'}")
-    
+
     # Collect chunks with validation
-    chunks, integrity_errors = collect_chunks_from_folder(folder, verify_checksums)
-    
+    chunks, integrity_errors = collect_chunks_from_folder(chunks_dir, verify_checksums)
+
     if not chunks:
         print("❌ No valid chunks found.")
-        sys.exit(1)
+        return False
 
     # Check completeness
     file_results = check_chunk_completeness(chunks)
@@ -188,7 +177,7 @@ def main():
             continue
         
         # Write reconstructed file
-        output_path = os.path.join(folder, filename)
+        output_path = os.path.join(chunks_dir, filename)
         with open(output_path, "w", encoding="utf-8") as out:
             out.write(combined)
         
@@ -200,5 +189,23 @@ def main():
         else:
             print(f"🎉 File reconstructed with full integrity verification!")
 
+    return True
+
+def main():
+    if len(sys.argv) not in [2, 3]:
+        print("Usage: python qr_rebuild_verified.py <folder_path> [--no-verify]")
+        print("  --no-verify: Skip checksum validation")
+        sys.exit(1)
+
+    folder = sys.argv[1]
+    verify_checksums = "--no-verify" not in sys.argv
+
+    if not os.path.isdir(folder):
+        print(f"Error: {folder} is not a valid folder.")
+        sys.exit(1)
+
+    if not rebuild(folder, verify_checksums):
+        sys.exit(1)
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file